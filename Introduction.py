@@ -2,24 +2,93 @@ from manim import *
 import random
 import itertools
 
-
-class Introduction(Scene):
-    def construct(self):
-        node_radius = 0.3
-        PLUS_ONE_COLOR = BLUE_D
-        MINUS_ONE_COLOR = RED_D
-        TEXT_COLOR = YELLOW
-        J_COLOR = YELLOW
-        H_COLOR = GREEN
-
+import ising
+from ising_graph import IsingGraph
+from live_equation import LiveEquation
+from hamiltonian_tex import HamiltonianFormula
+from spin_glyphs import SpinArrow, FlipSpin
+
+from segments import SegmentedScene
+import tex_cache
+import static_hold
+import frame_cache
+
+tex_cache.install()
+static_hold.install()
+frame_cache.install()
+
+
+class Introduction(SegmentedScene):
+    segments = [
+        "intro",
+        "tension",
+        "tension_dial",
+        "live_calculation",
+        "ground_state",
+        "three_people",
+        "hamiltonian",
+        "n_four",
+    ]
+
+    node_radius = 0.3
+    PLUS_ONE_COLOR = BLUE_D
+    MINUS_ONE_COLOR = RED_D
+    TEXT_COLOR = YELLOW
+    J_COLOR = YELLOW
+    H_COLOR = GREEN
+
+    # Everything a scenario file may change (see scenarios.py)
+    NAMES = ["Alice", "Bob", "Charlie", "Diana"]
+    NAME_FONT_SIZE = 36
+    J_COZY = -1
+    J_TENSE = 1
+
+    # Helpers shared by the three-person and N=4 segments
+    def create_person(self, name, position, name_above=False):
+        circle = Circle(radius=self.node_radius, color=WHITE, fill_opacity=0.8)
+
+        # Choose direction for name placement
+        direction = UP if name_above else DOWN
+        text_name = Text(name, font_size=self.NAME_FONT_SIZE).next_to(circle, direction, buff=0.2)
+
+        # Draw names on top of lines, with a background to avoid overlap
+        text_name.set_z_index(2)
+        text_name.add_background_rectangle(opacity=1, buff=0.05)
+
+        return VGroup(circle, text_name).move_to(position)
+
+    # label_pos_alpha slides the label along the line to prevent label overlap
+    def create_connection(self, node1, node2, label_text, label_pos_alpha=0.5):
+        circle1 = node1.submobjects[0]
+        circle2 = node2.submobjects[0]
+        p1, p2 = circle1.get_center(), circle2.get_center()
+        direction_vector = p2 - p1
+        unit_direction = direction_vector / np.linalg.norm(direction_vector)
+        
+        line = Line(
+            p1 + unit_direction * self.node_radius, 
+            p2 - unit_direction * self.node_radius, 
+            z_index=-1, color=TEAL, stroke_width=3
+        )
+        label = MathTex(label_text, color=self.J_COLOR).scale(1.2)
+        label.move_to(line.point_from_proportion(label_pos_alpha))
+        
+        line_angle = line.get_angle()
+        label.rotate(line_angle)
+        if (PI / 2) < abs(line_angle) < (3 * PI / 2):
+            label.rotate(PI)
+        label.add_background_rectangle(opacity=1, buff=0.1)
+        return VGroup(line, label)
+
+    def intro(self):
         ###changed the color of "or" in between and shifted both lines a bit lower, chaned the 2nd line yes and no format  
 
         title = MarkupText(
-            'Each person decides <span color="{0}">yes</span> or <span color="{0}">no</span> on some question.'.format(TEXT_COLOR),
+            'Each person decides <span color="{0}">yes</span> or <span color="{0}">no</span> on some question.'.format(self.TEXT_COLOR),
             font_size=36
         )
         subtitle = MarkupText(
-            'We’ll call “yes: <span color="{0}">+1</span>” and “no: <span color="{1}">–1</span>” .'.format(PLUS_ONE_COLOR, MINUS_ONE_COLOR),
+            'We’ll call “yes: <span color="{0}">+1</span>” and “no: <span color="{1}">–1</span>” .'.format(self.PLUS_ONE_COLOR, self.MINUS_ONE_COLOR),
             font_size=30
         )
 
@@ -32,22 +101,20 @@ class Introduction(Scene):
         self.wait()
 
          # --- OBJECTS (unchanged) ---
-        alice_circle = Circle(radius=node_radius, color=WHITE, fill_opacity=0.8).move_to(LEFT * 2.5)
-        alice_name = Text("Alice", font_size=36).next_to(alice_circle, DOWN, buff=0.3)
-        bob_circle = Circle(radius=node_radius, color=WHITE, fill_opacity=0.8).move_to(RIGHT * 2.5)
-        bob_name = Text("Bob", font_size=36).next_to(bob_circle, DOWN, buff=0.3)
-        up_arrow = Arrow(DOWN*0.2, UP*0.2, stroke_width=3, max_tip_length_to_length_ratio=0.35)
-        down_arrow = Arrow(UP*0.2, DOWN*0.2, stroke_width=3, max_tip_length_to_length_ratio=0.35)
+        alice_circle = Circle(radius=self.node_radius, color=WHITE, fill_opacity=0.8).move_to(LEFT * 2.5)
+        alice_name = Text(self.NAMES[0], font_size=self.NAME_FONT_SIZE).next_to(alice_circle, DOWN, buff=0.3)
+        bob_circle = Circle(radius=self.node_radius, color=WHITE, fill_opacity=0.8).move_to(RIGHT * 2.5)
+        bob_name = Text(self.NAMES[1], font_size=self.NAME_FONT_SIZE).next_to(bob_circle, DOWN, buff=0.3)
         
         # --- INITIAL ANIMATION (unchanged, just shortened for brevity in this view) ---
         self.play(Create(alice_circle), Create(bob_circle), Write(alice_name), Write(bob_name))
-        alice_up = up_arrow.copy().move_to(alice_circle.get_center())
-        alice_plus_text = MathTex("+1", color=TEXT_COLOR).next_to(alice_circle, UP)
-        bob_up = up_arrow.copy().move_to(bob_circle.get_center())
-        bob_plus_text = MathTex("+1", color=TEXT_COLOR).next_to(bob_circle, UP)
+        alice_up = SpinArrow(1).move_to(alice_circle.get_center())
+        alice_plus_text = MathTex("+1", color=self.TEXT_COLOR).next_to(alice_circle, UP)
+        bob_up = SpinArrow(1).move_to(bob_circle.get_center())
+        bob_plus_text = MathTex("+1", color=self.TEXT_COLOR).next_to(bob_circle, UP)
         self.play(
-            alice_circle.animate.set_color(PLUS_ONE_COLOR), Create(alice_up), Write(alice_plus_text),
-            bob_circle.animate.set_color(PLUS_ONE_COLOR), Create(bob_up), Write(bob_plus_text)
+            alice_circle.animate.set_color(self.PLUS_ONE_COLOR), Create(alice_up), Write(alice_plus_text),
+            bob_circle.animate.set_color(self.PLUS_ONE_COLOR), Create(bob_up), Write(bob_plus_text)
         )
         self.wait()
 
@@ -100,24 +167,22 @@ class Introduction(Scene):
             s1_val = int(table_data[i][0])
             s2_val = int(table_data[i][1])
 
-            # Define target states for Alice and Bob
-            alice_target_arrow = (up_arrow if s1_val == 1 else down_arrow).copy().move_to(alice_circle.get_center())
-            alice_target_text = MathTex(f"{s1_val:+}", color=TEXT_COLOR).next_to(alice_circle, UP)
-            alice_target_color = PLUS_ONE_COLOR if s1_val == 1 else MINUS_ONE_COLOR
+            # Define target states for Alice and Bob (the arrows flip in place)
+            alice_target_text = MathTex(f"{s1_val:+}", color=self.TEXT_COLOR).next_to(alice_circle, UP)
+            alice_target_color = self.PLUS_ONE_COLOR if s1_val == 1 else self.MINUS_ONE_COLOR
 
-            bob_target_arrow = (up_arrow if s2_val == 1 else down_arrow).copy().move_to(bob_circle.get_center())
-            bob_target_text = MathTex(f"{s2_val:+}", color=TEXT_COLOR).next_to(bob_circle, UP)
-            bob_target_color = PLUS_ONE_COLOR if s2_val == 1 else MINUS_ONE_COLOR
+            bob_target_text = MathTex(f"{s2_val:+}", color=self.TEXT_COLOR).next_to(bob_circle, UP)
+            bob_target_color = self.PLUS_ONE_COLOR if s2_val == 1 else self.MINUS_ONE_COLOR
             
             # Position the status text for this row
             current_status = status_texts[i-1].next_to(table.get_rows()[i], RIGHT, buff=0.7)
 
             # Animate everything together
             self.play(
-                Transform(alice_up, alice_target_arrow),
+                FlipSpin(alice_up, s1_val),
                 Transform(alice_plus_text, alice_target_text),
                 alice_circle.animate.set_color(alice_target_color),
-                Transform(bob_up, bob_target_arrow),
+                FlipSpin(bob_up, s2_val),
                 Transform(bob_plus_text, bob_target_text),
                 bob_circle.animate.set_color(bob_target_color),
                 Write(table.get_rows()[i]),
@@ -127,13 +192,18 @@ class Introduction(Scene):
             self.wait(0.5)
         
         self.wait()
-        
+
+        # Handed over to the next segment, which fades them out
+        self.alice_bob_group = alice_bob_group
+        self.intro_table_elements = VGroup(table, status_texts)
+
+    def tension(self):
         # --- NEW SEQUENCE STARTS HERE ---
 
         # 1. Clean up the previous scene
-        all_table_elements = VGroup(table, status_texts)
+        all_table_elements = self.intro_table_elements
         self.play(
-            FadeOut(alice_bob_group),
+            FadeOut(self.alice_bob_group),
             FadeOut(all_table_elements)
         )
         self.wait(0.5)
@@ -152,12 +222,12 @@ class Introduction(Scene):
         self.wait(0.5)
 
         # 3. Re-create Alice and Bob, more spread out
-        alice_circle_new = Circle(radius=node_radius, color=WHITE, fill_opacity=0.8)
-        alice_name_new = Text("Alice", font_size=36).next_to(alice_circle_new, DOWN, buff=0.3)
+        alice_circle_new = Circle(radius=self.node_radius, color=WHITE, fill_opacity=0.8)
+        alice_name_new = Text(self.NAMES[0], font_size=self.NAME_FONT_SIZE).next_to(alice_circle_new, DOWN, buff=0.3)
         alice_group_new = VGroup(alice_circle_new, alice_name_new).move_to(LEFT * 3)
 
-        bob_circle_new = Circle(radius=node_radius, color=WHITE, fill_opacity=0.8)
-        bob_name_new = Text("Bob", font_size=36).next_to(bob_circle_new, DOWN, buff=0.3)
+        bob_circle_new = Circle(radius=self.node_radius, color=WHITE, fill_opacity=0.8)
+        bob_name_new = Text(self.NAMES[1], font_size=self.NAME_FONT_SIZE).next_to(bob_circle_new, DOWN, buff=0.3)
         bob_group_new = VGroup(bob_circle_new, bob_name_new).move_to(RIGHT * 3)
 
         self.play(
@@ -167,7 +237,7 @@ class Introduction(Scene):
         self.wait()
 
          # 4. Add the J_12 label and the segmented connection line
-        j_label = MathTex("J_{12}", color=YELLOW).scale(1.2)
+        j_label = MathTex("J_{12}", color=self.J_COLOR).scale(1.2)
         j_label.move_to((alice_circle_new.get_center() + bob_circle_new.get_center()) / 2)
 
         # Create two separate lines that stop short of the label
@@ -194,11 +264,13 @@ class Introduction(Scene):
         )
         self.wait()
 
+        self.connection_group = VGroup(alice_group_new, bob_group_new, j_label, line1, line2)
 
+    def tension_dial(self):
         # --- NEW SEQUENCE STARTS HERE (CORRECTED LAYOUT) ---
 
         # 1. Group the existing elements and move them to the left
-        connection_group = VGroup(alice_group_new, bob_group_new, j_label, line1, line2)
+        connection_group = self.connection_group
         self.play(
             connection_group.animate.scale(0.9).to_edge(LEFT, buff=1.0)
         )
@@ -228,8 +300,8 @@ class Introduction(Scene):
         # Now that the axis is vertical, shift the numbers to the LEFT
         j_axis.numbers.shift(LEFT * 0.85)
 
-        j_axis_title = MathTex("J_{12}", "\\text{ dial}", color=YELLOW).next_to(j_axis, UP)  ###corrected the title
-        j_axis_title[1].set_color(YELLOW)
+        j_axis_title = MathTex("J_{12}", "\\text{ dial}", color=self.J_COLOR).next_to(j_axis, UP)  ###corrected the title
+        j_axis_title[1].set_color(self.J_COLOR)
         j_axis_title.shift(RIGHT * 0.3) 
 
         self.play(Create(j_axis), Write(j_axis_title))
@@ -249,7 +321,7 @@ class Introduction(Scene):
         ).next_to(j_axis.n2p(0), RIGHT, buff=0.4)
 
         # 4. Animate the explanations sequentially with a pointer dot
-        dot = Dot(color=YELLOW).scale(1.2)
+        dot = Dot(color=self.J_COLOR).scale(1.2)
 
         # J > 0 (Tense)
         dot.move_to(j_axis.n2p(1))
@@ -277,6 +349,7 @@ class Introduction(Scene):
         self.add(connection_group) 
         self.wait()
 
+    def live_calculation(self):
         # (This code follows immediately after the FadeOut of the first j_dial_group)
         # The 'connection_group' Mobject is still present on the screen.
         
@@ -284,16 +357,18 @@ class Introduction(Scene):
 
         # --- PART 1: DEFINE ALL OBJECTS AND CALCULATE FINAL LAYOUT ---
 
+        connection_group = self.connection_group
+
         # A) Create a target copy of the diagram to calculate its final position
         target_connection_group = connection_group.copy()
         target_connection_group.scale(0.9).to_edge(UP, buff=1.0)
 
         # B) Left Panel: Formulas (we won't show them yet)
         desc_font_size = 28
-        desc_part1 = MarkupText(f'<span color="{H_COLOR}">Conflict</span> = <span color="{PLUS_ONE_COLOR}">Alice\'s choice</span> × <span color="{J_COLOR}">Tension</span> × ', font_size=desc_font_size)
-        desc_bob_choice = MarkupText(f'<span color="{PLUS_ONE_COLOR}">Bob\'s choice</span>', font_size=desc_font_size)
+        desc_part1 = MarkupText(f'<span color="{self.H_COLOR}">Conflict</span> = <span color="{self.PLUS_ONE_COLOR}">{self.NAMES[0]}\'s choice</span> × <span color="{self.J_COLOR}">Tension</span> × ', font_size=desc_font_size)
+        desc_bob_choice = MarkupText(f'<span color="{self.PLUS_ONE_COLOR}">{self.NAMES[1]}\'s choice</span>', font_size=desc_font_size)
         desc_formula = VGroup(desc_part1, desc_bob_choice).arrange(RIGHT, buff=0.1)
-        math_formula = MathTex("H", "=", "s_1", "J_{12}", "s_2", tex_to_color_map={"H": H_COLOR, "s_1": PLUS_ONE_COLOR, "J_{12}": J_COLOR, "s_2": PLUS_ONE_COLOR}).scale(1.2)
+        math_formula = MathTex("H", "=", "s_1", "J_{12}", "s_2", tex_to_color_map={"H": self.H_COLOR, "s_1": self.PLUS_ONE_COLOR, "J_{12}": self.J_COLOR, "s_2": self.PLUS_ONE_COLOR}).scale(1.2)
         formulas_group = VGroup(desc_formula, math_formula).arrange(DOWN, buff=0.4)
         
         # We use the INVISIBLE target_connection_group to define the layout
@@ -303,11 +378,11 @@ class Introduction(Scene):
         dial_config = {"x_range": [-1.5, 1.5, 0.5], "length": 3.5, "include_numbers": False, "rotation": PI/2}
         j_dial = NumberLine(**dial_config)
         j_dial.add_numbers(x_values=[-1, 0, 1], font_size=24).numbers.shift(LEFT * 0.4)
-        j_dial_title = MathTex("J_{12}", color=J_COLOR).next_to(j_dial, UP)
+        j_dial_title = MathTex("J_{12}", color=self.J_COLOR).next_to(j_dial, UP)
         j_dial_group = VGroup(j_dial, j_dial.numbers, j_dial_title)
         h_dial = NumberLine(**dial_config)
         h_dial.add_numbers(x_values=[-1, 0, 1], font_size=24).numbers.shift(LEFT * 0.4)
-        h_dial_title = MathTex("H", color=H_COLOR).next_to(h_dial, UP)
+        h_dial_title = MathTex("H", color=self.H_COLOR).next_to(h_dial, UP)
         h_dial_group = VGroup(h_dial, h_dial.numbers, h_dial_title)
         right_panel = VGroup(j_dial_group, h_dial_group).arrange(0.9*RIGHT, buff=1)
         
@@ -332,92 +407,83 @@ class Introduction(Scene):
 
          # --- PART 3: DEMONSTRATION WITH LIVE CALCULATION ---
         
-        s1_val, s2_val, j_val = 1, 1, -1
-
-        def get_calc_text(s1, j, s2):
-            h = s1 * j * s2
-            text = MathTex("H", "=", f"({s1:+})", r"\times", f"({j:+})", r"\times", f"({s2:+})", "=", f"{h:+.0f}").scale(1.1)
-            text.next_to(math_formula, DOWN, buff=0.4)
-            text[0].set_color(H_COLOR)
-            text[2].set_color(PLUS_ONE_COLOR if s1 > 0 else MINUS_ONE_COLOR)
-            text[4].set_color(J_COLOR)
-            text[6].set_color(PLUS_ONE_COLOR if s2 > 0 else MINUS_ONE_COLOR)
-            text[8].set_color(H_COLOR)
-            return text
+        # One live equation for the whole demo: stepping its s1/J/s2 trackers
+        # swaps the number glyphs, and the dots follow the trackers
+        calculation_text = LiveEquation(
+            s1=1, j=-1, s2=1, font_size=DEFAULT_FONT_SIZE * 1.1,
+            h_color=self.H_COLOR, j_color=self.J_COLOR,
+            plus_color=self.PLUS_ONE_COLOR, minus_color=self.MINUS_ONE_COLOR,
+        ).next_to(math_formula, DOWN, buff=0.4)
 
         # We must now reference the sub-parts of the transformed connection_group
         alice_circle = connection_group.submobjects[0].submobjects[0]
         bob_circle = connection_group.submobjects[1].submobjects[0]
-        up_arrow = Arrow(DOWN*0.2, UP*0.2, stroke_width=3, max_tip_length_to_length_ratio=0.35)
-        down_arrow = Arrow(UP*0.2, DOWN*0.2, stroke_width=3, max_tip_length_to_length_ratio=0.35)
-        alice_spin = up_arrow.copy().move_to(alice_circle.get_center())
-        bob_spin = up_arrow.copy().move_to(bob_circle.get_center())
+        alice_spin = SpinArrow(1).move_to(alice_circle.get_center())
+        bob_spin = SpinArrow(1).move_to(bob_circle.get_center())
         
-        j_dot = Dot(color=J_COLOR, radius=0.1).move_to(j_dial.n2p(j_val))
-        h_dot = Dot(color=H_COLOR, radius=0.1).move_to(h_dial.n2p(s1_val * j_val * s2_val))
-        calculation_text = get_calc_text(s1_val, j_val, s2_val)
+        j_dot = Dot(color=self.J_COLOR, radius=0.1)
+        j_dot.add_updater(lambda d: d.move_to(j_dial.n2p(calculation_text.j.get_value())))
+        h_dot = Dot(color=self.H_COLOR, radius=0.1)
+        h_dot.add_updater(lambda d: d.move_to(h_dial.n2p(calculation_text.get_h())))
+        j_dot.update()
+        h_dot.update()
 
         self.play(
             Create(alice_spin), Create(bob_spin),
-            alice_circle.animate.set_color(PLUS_ONE_COLOR),
-            bob_circle.animate.set_color(PLUS_ONE_COLOR),
+            alice_circle.animate.set_color(self.PLUS_ONE_COLOR),
+            bob_circle.animate.set_color(self.PLUS_ONE_COLOR),
             FadeIn(j_dot), FadeIn(h_dot),
             Write(calculation_text)
         )
         self.wait(2)
         # (The rest of the demonstration remains the same)
-        s2_val = -1
-        new_calc = get_calc_text(s1_val, j_val, s2_val)
-        new_bob_spin = down_arrow.copy().move_to(bob_circle.get_center())
         self.play(
-            bob_circle.animate.set_color(MINUS_ONE_COLOR),
-            Transform(bob_spin, new_bob_spin),
-            h_dot.animate.move_to(h_dial.n2p(s1_val * j_val * s2_val)),
-            FadeToColor(math_formula[4], MINUS_ONE_COLOR),
-            desc_bob_choice.animate.set_color(MINUS_ONE_COLOR), 
-            Transform(calculation_text, new_calc), run_time=1.5
+            bob_circle.animate.set_color(self.MINUS_ONE_COLOR),
+            FlipSpin(bob_spin, -1),
+            calculation_text.s2.animate.set_value(-1),
+            FadeToColor(math_formula[4], self.MINUS_ONE_COLOR),
+            desc_bob_choice.animate.set_color(self.MINUS_ONE_COLOR), 
+            run_time=1.5
         )
         self.wait(2)
 
-        j_val = 1
-        new_calc = get_calc_text(s1_val, j_val, s2_val)
-        self.play(
-            j_dot.animate.move_to(j_dial.n2p(j_val)),
-            h_dot.animate.move_to(h_dial.n2p(s1_val * j_val * s2_val)),
-            Transform(calculation_text, new_calc), run_time=1.5
-        )
+        self.play(calculation_text.j.animate.set_value(1), run_time=1.5)
         self.wait(2)
 
-        s2_val = 1
-        new_calc = get_calc_text(s1_val, j_val, s2_val)
-        new_bob_spin_up = up_arrow.copy().move_to(bob_circle.get_center())
         self.play(
-            bob_circle.animate.set_color(PLUS_ONE_COLOR),
-            Transform(bob_spin, new_bob_spin_up),
-            h_dot.animate.move_to(h_dial.n2p(s1_val * j_val * s2_val)),
-            FadeToColor(math_formula[4], PLUS_ONE_COLOR),
-            desc_bob_choice.animate.set_color(PLUS_ONE_COLOR),
-            Transform(calculation_text, new_calc), run_time=1.5
+            bob_circle.animate.set_color(self.PLUS_ONE_COLOR),
+            FlipSpin(bob_spin, 1),
+            calculation_text.s2.animate.set_value(1),
+            FadeToColor(math_formula[4], self.PLUS_ONE_COLOR),
+            desc_bob_choice.animate.set_color(self.PLUS_ONE_COLOR),
+            run_time=1.5
         )
         self.wait(3)
 
+        # The demo is over; the readouts stop following the trackers
+        for mob in (calculation_text, j_dot, h_dot):
+            mob.clear_updaters()
+
+        self.demo_mobjects = VGroup(
+            connection_group, right_panel, formulas_group,
+            calculation_text, alice_spin, bob_spin, j_dot, h_dot
+        )
+
+    def ground_state(self):
         # (This code follows immediately after the previous sequence ends)
 
         # --- NEW SEQUENCE: FINDING THE GROUND STATE (CORRECTED DIAGRAM) ---
         
         # --- PART 1: CLEANUP AND RECAP ---
         
-        all_previous_mobjects = VGroup(
-            connection_group, right_panel, formulas_group,
-            calculation_text, alice_spin, bob_spin, j_dot, h_dot
-        )
+        all_previous_mobjects = self.demo_mobjects
         self.play(FadeOut(all_previous_mobjects))
         self.wait(0.5)
 
         DEFAULT_FONT_SIZE = 32
         recap_text = MarkupText(
             f"The <span color='{GREEN_D.to_hex()}'>'Conflict'</span> depends on their choices and the"
-            f"<span color='{YELLOW.to_hex()}'>'Tension'</span> between them.",
+            f"<span color='{self.J_COLOR.to_hex()}'>'Tension'</span> between them.",
             font_size=DEFAULT_FONT_SIZE
             )
         self.play(Write(recap_text))
@@ -425,20 +491,20 @@ class Introduction(Scene):
 
         # --- PART 2: POSE THE QUESTION ---
         ###chnaged the visual and location
-        question_text_1 = MarkupText(f"Now, let's assume the tension <span color='{YELLOW.to_hex()}'>J</span>"
+        question_text_1 = MarkupText(f"Now, let's assume the tension <span color='{self.J_COLOR.to_hex()}'>J</span>"
                                      f"is fixed. The question is:",font_size=DEFAULT_FONT_SIZE)
         
         #question_text_2a = MarkupText(f"<span color='{YELLOW.to_hex()}'>The question is:</span>", font_size=DEFAULT_FONT_SIZE)
         #question_text_2a.align_on_border(UP) 
         #question_text_2a.set_alignment("CENTER")  #horizontal centering
         question_text_2 = MarkupText(
-                        f"What choices will they make to <span color='{H_COLOR}'>minimize</span> "
-                        f"the <span color='{H_COLOR}'>conflict</span>?",
+                        f"What choices will they make to <span color='{self.H_COLOR}'>minimize</span> "
+                        f"the <span color='{self.H_COLOR}'>conflict</span>?",
                         font_size=DEFAULT_FONT_SIZE, line_spacing=0.7)
         question_text_2.move_to(ORIGIN)
 
         question_text_3 = MarkupText(
-                        f"This lowest-energy state is called the <span color='{H_COLOR}'>ground state</span>.",
+                        f"This lowest-energy state is called the <span color='{self.H_COLOR}'>ground state</span>.",
                         font_size=DEFAULT_FONT_SIZE,line_spacing=0.7)
         question_text_3.next_to(question_text_2, DOWN, buff=0.3)
  
@@ -465,8 +531,8 @@ class Introduction(Scene):
 
 
         table = MathTable(
-                [["+1", "+1", ""], ["+1", "-1", ""], ["-1", "+1", ""], ["-1", "-1", ""]],
-               col_labels=[MathTex("s_1"), MathTex("s_2"), MathTex("H", color=H_COLOR)],
+                [[f"{s1:+}", f"{s2:+}", ""] for s1, s2 in ising.all_configurations(2)],
+               col_labels=[MathTex("s_1"), MathTex("s_2"), MathTex("H", color=self.H_COLOR)],
                 include_outer_lines=True).scale(0.9).next_to(case_label, DOWN, buff=0.7)
 
         # Helper function to create the s_gs vector display   ####corrected and the formulas is aligned
@@ -501,17 +567,22 @@ class Introduction(Scene):
         self.wait(1)
 
         # C) Case 1: J = -1 ("Cozy")
-        j_val_cozy = -1
-        new_case_label_cozy = MathTex("J_{12}", "=", f"{j_val_cozy}").scale(1.5).move_to(case_label)
-        new_case_label_cozy[0].set_color(J_COLOR)
-        new_case_label_cozy[2].set_color(PLUS_ONE_COLOR)
+        j_val_cozy = self.J_COZY
+        new_case_label_cozy = MathTex("J_{12}", "=", f"{j_val_cozy:+}").scale(1.5).move_to(case_label)
+        new_case_label_cozy[0].set_color(self.J_COLOR)
+        new_case_label_cozy[2].set_color(self.PLUS_ONE_COLOR)
 
         s1_vals = [int(c.get_tex_string()) for c in table.get_columns()[0][1:]]
         s2_vals = [int(c.get_tex_string()) for c in table.get_columns()[1][1:]]
 
+        configurations = np.column_stack([s1_vals, s2_vals])
+        h_vals_cozy = ising.energies(ising.coupling_matrix(2, {(0, 1): j_val_cozy}), configurations)
+        # Ground states as 0-based table rows, from the exhaustive enumerator
+        gs_cozy = ising.enumerate_states(ising.coupling_matrix(2, {(0, 1): j_val_cozy})).ground_states
+
         h_col_data_cozy = VGroup(*[
-            MathTex(f"{{{j_val_cozy * s1 * s2:+}}}", color=H_COLOR).scale(0.9)
-            for s1, s2 in zip(s1_vals, s2_vals)])
+            MathTex(f"{{{h:+}}}", color=self.H_COLOR).scale(0.9)
+            for h in h_vals_cozy])
 
         for i, item in enumerate(h_col_data_cozy):
             cell_center = table.get_cell((i + 2, 3)).get_center()
@@ -522,8 +593,8 @@ class Introduction(Scene):
         self.wait(1)
 
         # Point to the first ground state
-        gs1_row = table.get_rows()[1]
-        gs_vector_display = create_gs_vector(1, 1).next_to(gs1_row, LEFT, buff=1.5)
+        gs1_row = table.get_rows()[gs_cozy[0] + 1]
+        gs_vector_display = create_gs_vector(*configurations[gs_cozy[0]]).next_to(gs1_row, LEFT, buff=1.5)
         pointer = Arrow(
             start=gs_vector_display.get_right() + RIGHT * 0.4,
             end=gs1_row.get_left() + LEFT * 0.1,
@@ -534,8 +605,8 @@ class Introduction(Scene):
         self.wait(2)
 
         # Move to the second ground state
-        gs2_row = table.get_rows()[4]
-        target_vector = create_gs_vector(-1, -1).next_to(gs2_row, LEFT, buff=1.5)
+        gs2_row = table.get_rows()[gs_cozy[1] + 1]
+        target_vector = create_gs_vector(*configurations[gs_cozy[1]]).next_to(gs2_row, LEFT, buff=1.5)
         target_pointer = Arrow(
             start=target_vector.get_right() + RIGHT * 0.4,
             end=gs2_row.get_left() + LEFT * 0.1,
@@ -550,14 +621,17 @@ class Introduction(Scene):
 
         # D) Case 2: J = +1 ("Tense")
         self.play(FadeOut(pointer), FadeOut(gs_vector_display))
-        j_val_tense = 1
-        new_case_label_tense = MathTex("J_{12}", "=", f"+{j_val_tense}").scale(1.5).move_to(case_label)
-        new_case_label_tense[0].set_color(J_COLOR)
-        new_case_label_tense[2].set_color(MINUS_ONE_COLOR)
+        j_val_tense = self.J_TENSE
+        new_case_label_tense = MathTex("J_{12}", "=", f"{j_val_tense:+}").scale(1.5).move_to(case_label)
+        new_case_label_tense[0].set_color(self.J_COLOR)
+        new_case_label_tense[2].set_color(self.MINUS_ONE_COLOR)
+
+        h_vals_tense = ising.energies(ising.coupling_matrix(2, {(0, 1): j_val_tense}), configurations)
+        gs_tense = ising.enumerate_states(ising.coupling_matrix(2, {(0, 1): j_val_tense})).ground_states
 
         h_col_data_tense = VGroup(*[
-            MathTex(f"{{{j_val_tense * s1 * s2:+}}}", color=H_COLOR).scale(0.9)
-            for s1, s2 in zip(s1_vals, s2_vals)
+            MathTex(f"{{{h:+}}}", color=self.H_COLOR).scale(0.9)
+            for h in h_vals_tense
         ])
 
         for i, item in enumerate(h_col_data_tense):
@@ -572,8 +646,8 @@ class Introduction(Scene):
         self.wait(1)
 
         # Point to the new ground states
-        gs1_row_new = table.get_rows()[2]
-        gs_vector_display = create_gs_vector(1, -1).next_to(gs1_row_new, LEFT, buff=1.5)
+        gs1_row_new = table.get_rows()[gs_tense[0] + 1]
+        gs_vector_display = create_gs_vector(*configurations[gs_tense[0]]).next_to(gs1_row_new, LEFT, buff=1.5)
         pointer = Arrow(
             start=gs_vector_display.get_right() + RIGHT * 0.4,
             end=gs1_row_new.get_left() + LEFT * 0.1,
@@ -583,8 +657,8 @@ class Introduction(Scene):
         self.play(Write(gs_vector_display), GrowArrow(pointer))
         self.wait(2)
 
-        gs2_row_new = table.get_rows()[3]
-        target_vector = create_gs_vector(-1, 1).next_to(gs2_row_new, LEFT, buff=1.5)
+        gs2_row_new = table.get_rows()[gs_tense[1] + 1]
+        target_vector = create_gs_vector(*configurations[gs_tense[1]]).next_to(gs2_row_new, LEFT, buff=1.5)
         target_pointer = Arrow(
             start=target_vector.get_right() + RIGHT * 0.4,
             end=gs2_row_new.get_left() + LEFT * 0.1,
@@ -597,12 +671,15 @@ class Introduction(Scene):
         )
         self.wait(3)
 
+        self.ground_state_mobjects = VGroup(case_label, table, h_col_data_cozy, pointer, gs_vector_display)
+
+    def three_people(self):
         # (This code follows immediately after the previous sequence ends)
 
         # --- NEW SEQUENCE: THREE PEOPLE (FINAL POLISHED VERSION) ---
 
         # 1. Clean up all elements from the previous scene
-        all_table_elements = VGroup(case_label, table, h_col_data_cozy, pointer, gs_vector_display)
+        all_table_elements = self.ground_state_mobjects
         self.play(FadeOut(all_table_elements))
         self.wait(0.5)
 
@@ -613,52 +690,19 @@ class Introduction(Scene):
         self.play(FadeOut(question_text))
         self.wait(0.5)
 
-        # 3. Define helper functions with corrected, robust logic
-        node_radius = 0.3
-
-        def create_person(name, position, name_above=False):
-            circle = Circle(radius=node_radius, color=WHITE, fill_opacity=0.8)
-
-            # Choose direction for name placement
-            direction = UP if name_above else DOWN
-            text_name = Text(name, font_size=36).next_to(circle, direction, buff=0.2)
-
-            # Draw names on top of lines, with a background to avoid overlap
-            text_name.set_z_index(2)
-            text_name.add_background_rectangle(opacity=1, buff=0.05)
-
-            return VGroup(circle, text_name).move_to(position)
-
-
-        def create_connection(node1, node2, label_text):
-            circle1 = node1.submobjects[0]
-            circle2 = node2.submobjects[0]
-            p1, p2 = circle1.get_center(), circle2.get_center()
-            direction_vector = p2 - p1
-            unit_direction = direction_vector / np.linalg.norm(direction_vector)
-            line = Line(p1 + unit_direction * node_radius, p2 - unit_direction * node_radius, z_index=-1, color=TEAL, stroke_width=3)
-            label = MathTex(label_text, color=J_COLOR).scale(1.2)
-            label.move_to(line.get_center())
-            line_angle = line.get_angle()
-            label.rotate(line_angle)
-            if (PI / 2) < abs(line_angle) < (3 * PI / 2):
-                label.rotate(PI)
-            label.add_background_rectangle(opacity=1, buff=0.1)
-            return VGroup(line, label)
-
-        # 4. Define the nodes in a triangle layout
-        alice_node = create_person("Alice", UP * 2.2, name_above=True)
-        bob_node = create_person("Bob", DOWN * 1.5 + LEFT * 2.5)
-        charlie_node = create_person("Charlie", DOWN * 1.5 + RIGHT * 2.5)
+        # 3. Define the nodes in a triangle layout
+        alice_node = self.create_person(self.NAMES[0], UP * 2.2, name_above=True)
+        bob_node = self.create_person(self.NAMES[1], DOWN * 1.5 + LEFT * 2.5)
+        charlie_node = self.create_person(self.NAMES[2], DOWN * 1.5 + RIGHT * 2.5)
         
         all_nodes = VGroup(alice_node, bob_node, charlie_node)
         self.play(Create(all_nodes))
         self.wait(1)
 
-        # 5. Define and animate the connections using the new, smooth technique
-        connection_12 = create_connection(alice_node, bob_node, "J_{12}")
-        connection_13 = create_connection(alice_node, charlie_node, "J_{13}")
-        connection_23 = create_connection(bob_node, charlie_node, "J_{23}")
+        # 4. Define and animate the connections using the new, smooth technique
+        connection_12 = self.create_connection(alice_node, bob_node, "J_{12}")
+        connection_13 = self.create_connection(alice_node, charlie_node, "J_{13}")
+        connection_23 = self.create_connection(bob_node, charlie_node, "J_{23}")
 
         self.play(
             LaggedStart(
@@ -670,7 +714,10 @@ class Introduction(Scene):
             )
         )
         self.wait(3)
-    
+
+        self.triangle_system = VGroup(all_nodes, connection_12, connection_13, connection_23)
+
+    def hamiltonian(self):
         # (This code follows immediately after the previous sequence ends)
 
         # (This code follows immediately after the previous sequence ends)
@@ -678,7 +725,7 @@ class Introduction(Scene):
         # --- NEW SEQUENCE: BUILDING THE HAMILTONIAN (DEFINITIVE CORRECTED VERSION) ---
 
         # 1. Group the entire system and move it to the left
-        triangle_system = VGroup(all_nodes, connection_12, connection_13, connection_23)
+        triangle_system = self.triangle_system
         self.play(
             triangle_system.animate.scale(0.8).to_edge(LEFT, buff=1.0)
         )
@@ -689,14 +736,11 @@ class Introduction(Scene):
 
         # 3. Create and animate the individual conflict formulas
         
-        # Create each formula and arrange them vertically
-        h12_formula = MathTex("H_{12}", "=", "s_1", "J_{12}", "s_2", tex_to_color_map={"H_{12}": H_COLOR, "J_{12}": J_COLOR})
-        h13_formula = MathTex("H_{13}", "=", "s_1", "J_{13}", "s_3", tex_to_color_map={"H_{13}": H_COLOR, "J_{13}": J_COLOR})
-        h23_formula = MathTex("H_{23}", "=", "s_2", "J_{23}", "s_3", tex_to_color_map={"H_{23}": H_COLOR, "J_{23}": J_COLOR})
-
-        for f in [h12_formula, h13_formula, h23_formula]:
-            f.set_color_by_tex("=", WHITE)
-            f.scale(1.2)
+        # Create each formula (one TeX compile each) and arrange them vertically
+        h12_formula, h13_formula, h23_formula = [
+            HamiltonianFormula([(i, j)], lhs=f"H_{{{i + 1}{j + 1}}}", h_color=self.H_COLOR, j_color=self.J_COLOR).scale(1.2)
+            for i, j in [(0, 1), (0, 2), (1, 2)]
+        ]
 
         # Position them vertically
         h12_formula.move_to(formula_pos + UP * 1.0)
@@ -712,18 +756,10 @@ class Introduction(Scene):
 
         # 4. Reveal the total Hamiltonian in a two-line format with a title
         
-        # Create each part of the equation separately
-        # All terms and symbols on a single line
-        h_total_label = MathTex("H").set_color(H_COLOR)
-        equal_sign = MathTex("=").set_color(WHITE)
-        term1 = MathTex("s_1 J_{12} s_2").set_color_by_tex("J", J_COLOR)
-        plus1 = MathTex("+").set_color(WHITE)
-        term2 = MathTex("s_1 J_{13} s_3").set_color_by_tex("J", J_COLOR)
-        plus2 = MathTex("+").set_color(WHITE)
-        term3 = MathTex("s_2 J_{23} s_3").set_color_by_tex("J", J_COLOR)
-
-        # Arrange in one line
-        full_formula = VGroup(h_total_label, equal_sign, term1, plus1, term2, plus2, term3).arrange(RIGHT, buff=0.2)
+        # The whole equation on a single line, as one TeX compile
+        full_formula = HamiltonianFormula([(0, 1), (0, 2), (1, 2)], h_color=self.H_COLOR)
+        for term in full_formula.terms:
+            term.set_color(self.J_COLOR)
 
         
         # --- NEW --- Create the title and group it with the formula
@@ -736,51 +772,29 @@ class Introduction(Scene):
         self.play(ReplacementTransform(all_h_formulas, n3_hamiltonian_group))
         self.wait(4)
 
+    def n_four(self):
         # (This code follows immediately after the previous sequence ends)
 
         # --- NEW SEQUENCE: GENERALIZING TO N=4 AND THE SUMMATION (REVISED) ---
 
-        # 1. Modify the connection helper to prevent label overlap
-        def create_connection(node1, node2, label_text, label_pos_alpha=0.5):
-            circle1 = node1.submobjects[0]
-            circle2 = node2.submobjects[0]
-            p1, p2 = circle1.get_center(), circle2.get_center()
-            direction_vector = p2 - p1
-            unit_direction = direction_vector / np.linalg.norm(direction_vector)
-            
-            line = Line(
-                p1 + unit_direction * node_radius, 
-                p2 - unit_direction * node_radius, 
-                z_index=-1, color=TEAL, stroke_width=3
-            )
-            label = MathTex(label_text, color=J_COLOR).scale(1.2)
-            label.move_to(line.point_from_proportion(label_pos_alpha))
-            
-            line_angle = line.get_angle()
-            label.rotate(line_angle)
-            if (PI / 2) < abs(line_angle) < (3 * PI / 2):
-                label.rotate(PI)
-            label.add_background_rectangle(opacity=1, buff=0.1)
-            return VGroup(line, label)
-
-        # 2. Prepare the N=4 system and the new Hamiltonian layout
-        
-        # A. Create the N=4 graph nodes
-        alice_node_sq = create_person("Alice", UP * 2.0 + LEFT * 2.0, name_above=True)
-        bob_node_sq = create_person("Bob", UP * 2.0 + RIGHT * 2.0, name_above=True)
-        charlie_node_sq = create_person("Charlie", DOWN * 2.0 + LEFT * 2.0)
-        diana_node = create_person("Diana", DOWN * 2.0 + RIGHT * 2.0)
-        all_nodes_n4 = VGroup(alice_node_sq, bob_node_sq, charlie_node_sq, diana_node)
-
-        # B. Create N=4 connections, offsetting diagonal labels to avoid overlap
-        connections_n4 = VGroup(
-            create_connection(alice_node_sq, bob_node_sq, "J_{12}"),
-            create_connection(charlie_node_sq, diana_node, "J_{34}"),
-            create_connection(alice_node_sq, charlie_node_sq, "J_{13}"),
-            create_connection(bob_node_sq, diana_node, "J_{24}"),
-            create_connection(alice_node_sq, diana_node, "J_{14}", label_pos_alpha=0.6), # Offset
-            create_connection(bob_node_sq, charlie_node_sq, "J_{23}", label_pos_alpha=0.4)  # Offset
-        )
-        n4_system = VGroup(all_nodes_n4, connections_n4).scale(0.8).to_edge(LEFT, buff=1.0)
+        # 1. Prepare the N=4 system and the new Hamiltonian layout
         
-       
\ No newline at end of file
+        # A. Create the graph, one node per name: every pair is coupled, all edges batched in one mobject
+        n = len(self.NAMES)
+        if n == 4:
+            positions = [UP * 2.0 + LEFT * 2.0, UP * 2.0 + RIGHT * 2.0, DOWN * 2.0 + LEFT * 2.0, DOWN * 2.0 + RIGHT * 2.0]
+            name_directions = [UP, UP, DOWN, DOWN]
+            # The hand-tuned square: diagonal labels offset to either side of the crossing
+            label_alphas = {(0, 3): 0.6, (1, 2): 0.4}
+        else:
+            # Other sizes go round a circle, with the names and labels placed automatically
+            positions = [2.5 * np.array([np.sin(a), np.cos(a), 0]) for a in np.linspace(0, TAU, n, endpoint=False)]
+            name_directions = label_alphas = None
+        n4_system = IsingGraph(
+            positions, np.ones((n, n), dtype=int),
+            names=self.NAMES,
+            name_directions=name_directions,
+            name_font_size=self.NAME_FONT_SIZE,
+            node_radius=self.node_radius,
+            edge_labels=True, label_color=self.J_COLOR, label_alphas=label_alphas,
+        ).scale(0.8).to_edge(LEFT, buff=1.0)
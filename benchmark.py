@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from manim import tempconfig
+
+from render_parallel import QUALITIES, load_scene
+
+
+# Render benchmarks, to catch changes that make the video slower to build.
+#
+#   python benchmark.py Introduction.py Introduction
+#   python benchmark.py Introduction.py Introduction --slices ground_state -q l --threshold 5
+#
+# A slice is one segment of a SegmentedScene, rendered with render_only (the
+# segments before it are replayed without rendering, as in render_parallel).
+# Each slice is rendered at every quality twice, each time in a fresh
+# media_dir: cold, with every cache empty, then warm, with only the TeX, text,
+# glyph and layout caches of the cold run copied over. The movie, frame and
+# segment caches stay empty, so a warm run still rasterizes and encodes every
+# frame; it measures the render without the one-off TeX and Pango work. No
+# prewarm runs, so a cold run compiles its TeX inline. Every render runs in
+# its own Python process, so its peak RSS is its own. Time, peak RSS and
+# output size are appended to the results file under the current git commit,
+# and the run fails when a slice is slower (or bigger in memory) than the
+# last passing run by more than the threshold. A slice without play calls
+# renders nothing and is an error. Everything is local: manim, LaTeX and
+# ffmpeg, no network, no GPU.
+
+DEFAULT_SLICES = [
+    "intro",             # the 4-row table loop, flipping the spin arrows
+    "live_calculation",  # the live H calculation with the dials
+    "ground_state",      # the two ground-state tables and their H columns
+]
+
+# What a warm run starts with (relative to media_dir): compiled TeX, Pango's
+# text SVGs, tex_cache's glyphs and text layouts
+WARM_CACHES = ["Tex", "texts", "glyph_cache", "text_cache"]
+
+# 2: warm runs no longer reuse the cold run's movie and segment caches
+RESULTS_SCHEMA = 2
+
+
+def render_once(scene_file, scene_name, segment, quality, media_dir):
+    # Runs in the child process: render one slice and report on stdout
+    scene_cls = load_scene(scene_file, scene_name)
+    start = time.perf_counter()
+    with tempconfig({"quality": quality, "media_dir": media_dir, "output_file": f"{scene_name}_{segment}"}):
+        scene = scene_cls(render_only=segment)
+        scene.render()
+        size = sum(Path(f).stat().st_size for f in scene.rendered_movie_files())
+    return {
+        "time": time.perf_counter() - start,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "output_bytes": size,
+    }
+
+
+def measure(scene_file, scene_name, segment, quality, media_dir):
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", scene_file, scene_name, segment, quality, media_dir],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmarks(scene_file, scene_name, slices, qualities):
+    results = {}
+    for segment in slices:
+        for quality in qualities:
+            with tempfile.TemporaryDirectory(prefix="bench_media_") as root:
+                for cache in ("cold", "warm"):
+                    media_dir = Path(root) / cache
+                    if cache == "warm":
+                        for cache_dir in WARM_CACHES:
+                            if (Path(root) / "cold" / cache_dir).exists():
+                                shutil.copytree(Path(root) / "cold" / cache_dir, media_dir / cache_dir)
+                    name = f"{segment}/{quality}/{cache}"
+                    results[name] = measure(scene_file, scene_name, segment, QUALITIES[quality], str(media_dir))
+                    if not results[name]["output_bytes"]:
+                        sys.exit(f"{segment} has no play calls, so there is nothing to render; pick another slice")
+                    print(f"{name:40} {results[name]['time']:8.2f} s {results[name]['peak_rss_mb']:8.1f} MB")
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def regressions(previous, current, threshold):
+    found = []
+    for name, result in current.items():
+        if name not in previous:
+            continue
+        for metric in ("time", "peak_rss_mb"):
+            before, after = previous[name][metric], result[metric]
+            if before > 0 and (after - before) / before * 100 > threshold:
+                found.append(f"{name} {metric}: {before:.2f} -> {after:.2f} (+{(after - before) / before:.0%})")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rendering slices of a scene and check for regressions.")
+    parser.add_argument("file", help="path to the scene file")
+    parser.add_argument("scene", help="name of the SegmentedScene class")
+    parser.add_argument("--slices", nargs="+", default=DEFAULT_SLICES, help="segments to render")
+    parser.add_argument("-q", "--qualities", nargs="+", choices=QUALITIES, default=["l", "h"])
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown, in percent")
+    parser.add_argument("--results", default="benchmark_results.json", help="results file to compare with and append to")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args, rest = parser.parse_known_args()
+
+    if args.child:
+        # --child scene_file scene_name segment quality media_dir
+        print(json.dumps(render_once(args.file, args.scene, *rest)))
+        return
+
+    results_file = Path(args.results)
+    history = json.loads(results_file.read_text()) if results_file.exists() else {"schema": RESULTS_SCHEMA, "runs": []}
+    if history.get("schema") != RESULTS_SCHEMA:
+        sys.exit(f"{results_file} has results schema {history.get('schema')}, expected {RESULTS_SCHEMA}")
+
+    results = run_benchmarks(args.file, args.scene, args.slices, args.qualities)
+    passed = [run for run in history["runs"] if run["passed"]]
+    found = regressions(passed[-1]["results"], results, args.threshold) if passed else []
+
+    history["runs"].append({
+        "commit": git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "results": results,
+        "passed": not found,
+    })
+    results_file.write_text(json.dumps(history, indent=2))
+
+    if found:
+        print(f"Regressions beyond {args.threshold}%:")
+        for line in found:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+from manim import *
+
+import ising
+from glyphs import GlyphSet
+
+
+# A table of spin configurations for N far beyond the four-row MathTable.
+#
+# MathTable typesets every cell of every row, 2^N x (N + 1) MathTex. This
+# table only ever has window + 1 row mobjects. position (a ValueTracker) is
+# the configuration shown in the top row; an updater puts configuration
+# floor(position) + r in row r and refills that row's cells with GlyphSet
+# copies only when its configuration changes. Scrolling is animating
+# position: rows slide between the fixed grid lines, fade out at the edges of
+# the window and come back in at the other end with new contents. H comes
+# from an energy array (which may be memory-mapped) or is computed from J for
+# the visible rows only, so memory and construction time depend on the
+# window, not on 2^N.
+#
+# Rows are in ising.all_configurations order, configuration k being
+# ising.configurations_from_indices([k], n).
+
+class ConfigurationTable(VGroup):
+    def __init__(
+        self,
+        n,
+        window=8,
+        energies=None,
+        cell_width=1.2,
+        row_height=0.8,
+        font_size=DEFAULT_FONT_SIZE,
+        spin_color=WHITE,
+        h_color=GREEN,
+        line_color=WHITE,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.n = n
+        self.count = 1 << n
+        self.window = min(window, self.count)
+        self.glyphs = GlyphSet(font_size=font_size)
+        self.spin_color, self.h_color = spin_color, h_color
+        self.position = ValueTracker(0)
+
+        columns = n + 1
+        self.base_width, self.base_row_height = columns * cell_width, row_height
+        width, height = self.base_width, (self.window + 1) * row_height
+        # Header row plus window rows, with outer lines, as MathTable(include_outer_lines=True)
+        self.grid = VGroup(
+            *[Line(LEFT * width / 2, RIGHT * width / 2).shift(UP * (height / 2 - r * row_height)) for r in range(self.window + 2)],
+            *[Line(UP * height / 2, DOWN * height / 2).shift(RIGHT * (c * cell_width - width / 2)) for c in range(columns + 1)],
+        ).set_stroke(line_color)
+        self.header = VGroup(
+            *[MathTex(f"s_{{{i + 1}}}", font_size=font_size) for i in range(n)],
+            MathTex("H", color=h_color, font_size=font_size),
+        )
+        for c, label in enumerate(self.header):
+            label.move_to([(c + 0.5) * cell_width - width / 2, (height - row_height) / 2, 0])
+        self.rows = VGroup(*[VGroup(*[VGroup() for _ in range(columns)]) for _ in range(self.window + 1)])
+        self.shown = [None] * len(self.rows)
+        self.add(self.grid, self.header, self.rows)
+
+        self.version = 0
+        self.set_energies(energies)
+        self.add_updater(lambda m: m.layout())
+
+    def set_energies(self, source):
+        # source: an array of all 2^n energies, a coupling matrix J, or None for an empty H column
+        self.source = source
+        self.version += 1
+        return self.layout()
+
+    def energy(self, k, spins):
+        if self.source is None:
+            return None
+        if np.ndim(self.source) == 1:
+            return self.source[k]
+        return ising.energy(self.source, spins)
+
+    def fill(self, row, k, scale):
+        if k >= self.count:
+            for cell in row:
+                cell.submobjects = []
+            return
+        spins = ising.configurations_from_indices([k], self.n)[0]
+        texts = [(f"{s:+}", self.spin_color) for s in spins]
+        h = self.energy(k, spins)
+        if h is None:
+            texts.append(("", self.h_color))
+        elif float(h).is_integer():
+            texts.append((f"{int(h):+}", self.h_color))
+        else:
+            texts.append((f"{h:+.2f}", self.h_color))
+        for cell, (text, color) in zip(row, texts):
+            cell.submobjects = self.glyphs.text(text, color).scale(scale, about_point=ORIGIN).submobjects
+
+    def layout(self):
+        scale = self.grid[0].width / self.base_width
+        row_height = self.base_row_height * scale
+        position = self.position.get_value()
+        top = int(np.floor(position))
+        for r, row in enumerate(self.rows):
+            if self.shown[r] != (top + r, self.version):
+                self.shown[r] = (top + r, self.version)
+                self.fill(row, top + r, scale)
+            # t: rows below the first data row; fully in view for 0 <= t <= window - 1
+            t = r - (position - top)
+            for cell, label in zip(row, self.header):
+                if len(cell):
+                    cell.move_to(label.get_center() + DOWN * (t + 1) * row_height)
+            row.set_opacity(np.clip(min(1 + 2 * t, 2 * (self.window - 1 - t) + 1), 0, 1))
+        return self
+
+    def row_of(self, k):
+        # The row mobject now showing configuration k, or None if it is out of view
+        top = int(np.floor(self.position.get_value()))
+        return self.rows[k - top] if 0 <= k - top < len(self.rows) else None
+
+    def ground_rows(self):
+        if np.ndim(self.source) == 1:
+            return np.flatnonzero(self.source == np.min(self.source))
+        return ising.enumerate_states(self.source).ground_states
+
+    def scroll_to(self, k, **kwargs):
+        # Animation that brings configuration k to the middle of the window
+        top = int(np.clip(k - self.window // 2, 0, self.count - self.window))
+        return self.position.animate(**kwargs).set_value(top)
+
+    def jump_to_ground_state(self, **kwargs):
+        return self.scroll_to(self.ground_rows()[0], **kwargs)
@@ -0,0 +1,156 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from manim import *
+
+import label_layout
+from render_parallel import load_scene
+
+
+# Runs a scene's construct for its layout only: no frames, no ffmpeg.
+#
+#   python dry_run.py Introduction.py Introduction
+#
+# The scene is built with skip_animations, so every play/wait jumps straight
+# to its end state (one update, no rasterizing), and with dry_run, so nothing
+# is written. After every call the mobjects on screen are checked:
+#
+#   overflow   a top-level mobject sticks out of the frame
+#   overlap    two top-level mobjects partly overlap (one inside the other,
+#              like an arrow in its circle, is composition and is not reported)
+#
+# Each problem is reported once, at the call where it first appears, with the
+# timeline (total run time per segment). Only visible parts count: points of
+# mobjects with some fill or stroke opacity. --strict exits non-zero on
+# overflows, so it can run on every commit.
+
+
+def describe(mob):
+    # Class name plus the first text in it, enough to find it in the source
+    for part in mob.get_family():
+        text = getattr(part, "tex_string", None) or getattr(part, "text", None)
+        if isinstance(text, str) and text.strip():
+            return f"{type(mob).__name__}({text.strip()[:30]!r})"
+    return type(mob).__name__
+
+
+def visible_box(mob):
+    points = []
+    for part in mob.get_family():
+        if not len(part.points):
+            continue
+        if isinstance(part, VMobject):
+            stroked = part.get_stroke_width() > 0 and part.get_stroke_opacity() > 0
+            if part.get_fill_opacity() == 0 and not stroked:
+                continue
+        points.append(part.points)
+    if not points:
+        return None
+    points = np.concatenate(points)
+    return (*points[:, :2].min(axis=0), *points[:, :2].max(axis=0))
+
+
+class LayoutChecker:
+    def __init__(self, scene, tolerance=0.01):
+        self.scene = scene
+        self.tolerance = tolerance
+        self.segment = "construct"
+        self.calls = []
+        self.timeline = {}
+        self.overflows = {}
+        self.overlaps = {}
+
+    def attach(self):
+        play = self.scene.play
+
+        def checked_play(*args, **kwargs):
+            play(*args, **kwargs)
+            self.check(args)
+
+        self.scene.play = checked_play
+        if hasattr(self.scene, "play_segment"):
+            play_segment = self.scene.play_segment
+
+            def tracked_play_segment(name):
+                self.segment = name
+                return play_segment(name)
+
+            self.scene.play_segment = tracked_play_segment
+
+    def check(self, animations):
+        index = len(self.calls)
+        self.calls.append({
+            "segment": self.segment,
+            "animations": [type(anim).__name__ for anim in animations],
+            "run_time": self.scene.duration,
+        })
+        self.timeline[self.segment] = self.timeline.get(self.segment, 0) + self.scene.duration
+
+        boxes = []
+        for mob in self.scene.mobjects:
+            box = visible_box(mob)
+            if box is None:
+                continue
+            boxes.append((mob, box))
+            by = label_layout.overflow(box, config.frame_x_radius, config.frame_y_radius)
+            if by > self.tolerance and id(mob) not in self.overflows:
+                self.overflows[id(mob)] = {
+                    "segment": self.segment, "call": index, "mobject": describe(mob), "by": round(float(by), 3),
+                }
+
+        # Pairs of top-level mobjects, found through the label placer's grid
+        for i, j, area in label_layout.partial_overlaps([box for _, box in boxes]):
+            key = frozenset((id(boxes[i][0]), id(boxes[j][0])))
+            if area > self.tolerance and key not in self.overlaps:
+                self.overlaps[key] = {
+                    "segment": self.segment, "call": index,
+                    "mobjects": [describe(boxes[i][0]), describe(boxes[j][0])], "area": round(float(area), 3),
+                }
+
+    def report(self):
+        return {
+            "timeline": {**self.timeline, "total": sum(self.timeline.values())},
+            "calls": len(self.calls),
+            "overflows": list(self.overflows.values()),
+            "overlaps": list(self.overlaps.values()),
+        }
+
+
+def dry_run(scene_file, scene_name):
+    scene_cls = load_scene(scene_file, scene_name)
+    with tempconfig({"dry_run": True, "disable_caching": True, "progress_bar": "none"}):
+        scene = scene_cls(skip_animations=True)
+        checker = LayoutChecker(scene)
+        checker.attach()
+        scene.render()
+    return checker.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a scene without rendering and check its layout.")
+    parser.add_argument("file", help="path to the scene file")
+    parser.add_argument("scene", help="name of the scene class")
+    parser.add_argument("--json", default=None, help="also write the report to this file")
+    parser.add_argument("--strict", action="store_true", help="exit non-zero if anything leaves the frame")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = dry_run(args.file, args.scene)
+    print(f"{report['calls']} play/wait calls in {time.perf_counter() - start:.1f} s")
+    for segment, seconds in report["timeline"].items():
+        print(f"  {segment:24} {seconds:7.1f} s")
+    for overflow in report["overflows"]:
+        print(f"overflow  [{overflow['segment']} #{overflow['call']}] {overflow['mobject']} by {overflow['by']}")
+    for overlap in report["overlaps"]:
+        print(f"overlap   [{overlap['segment']} #{overlap['call']}] {' / '.join(overlap['mobjects'])} ({overlap['area']})")
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    if args.strict and report["overflows"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
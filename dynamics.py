@@ -0,0 +1,105 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import ising
+import solver
+
+
+# Monte Carlo dynamics, precomputed and streamed into the scene.
+#
+# A trajectory is recorded once, one frame per sweep, into an .npy file that
+# is written through a memory map, so only the current configuration is ever
+# held in memory however many sweeps are recorded. Each sweep updates the
+# spins one independent class at a time, all spins of a class at once:
+#   - on an L x L periodic lattice (J=None) the classes are the two colours of
+#     a checkerboard and the local field is four np.roll's;
+#   - on a coupling matrix J they are solver.color_classes and the field is
+#     J s, as in solver.py.
+# Flips are accepted with the Metropolis rule min(1, exp(-beta dE)) or the
+# Glauber (heat bath) rule 1 / (1 + exp(beta dE)), with dE = -2 s_i h_i.
+#
+# stream() then plays the file back with one updater, so a thousand-sweep
+# relaxation is a single self.wait:
+#
+#   dynamics.record_trajectory("relax.npy", spins, steps=1000, beta=0.6)
+#   update, duration = dynamics.stream(lattice, "relax.npy")
+#   self.wait(duration)
+#   lattice.remove_updater(update)
+#
+# Anything with set_spins can be streamed to: SpinLattice or IsingGraph.
+
+
+def checkerboard(shape):
+    if shape[0] % 2 or shape[1] % 2:
+        raise ValueError(f"A periodic checkerboard needs even sides, got {shape[0]} x {shape[1]}")
+    black = np.add.outer(np.arange(shape[0]), np.arange(shape[1])) % 2 == 0
+    return [black, ~black]
+
+
+def lattice_field(coupling):
+    def field(s):
+        return coupling * (np.roll(s, 1, 0) + np.roll(s, -1, 0) + np.roll(s, 1, 1) + np.roll(s, -1, 1))
+    return field
+
+
+def sweep(spins, field, classes, beta, rule, rng):
+    for cls in classes:
+        dE = -2.0 * spins * field(spins)
+        if rule == "metropolis":
+            accept = np.exp(-beta * np.maximum(dE, 0))
+        elif rule == "glauber":
+            accept = 1 / (1 + np.exp(np.clip(beta * dE, -50, 50)))
+        else:
+            raise ValueError(f"Unknown update rule {rule!r}, expected 'metropolis' or 'glauber'")
+        spins[cls & (rng.random(spins.shape) < accept)] *= -1
+
+
+def record_trajectory(path, spins, steps, beta, J=None, coupling=-1, rule="metropolis", seed=None):
+    # J=None: periodic lattice with the same coupling on every bond (-1 = cozy)
+    rng = np.random.default_rng(seed)
+    spins = np.array(spins, dtype=np.int8)
+    if J is None:
+        field, classes = lattice_field(coupling), checkerboard(spins.shape)
+    else:
+        full = ising.symmetric_couplings(J)
+        field = lambda s: full @ s
+        classes = []
+        for cls in solver.color_classes(full):
+            mask = np.zeros(spins.shape, dtype=bool)
+            mask[cls] = True
+            classes.append(mask)
+
+    frames = np.lib.format.open_memmap(path, mode="w+", dtype=np.int8, shape=(steps + 1, *spins.shape))
+    frames[0] = spins
+    for step in range(1, steps + 1):
+        sweep(spins, field, classes, beta, rule, rng)
+        frames[step] = spins
+    frames.flush()
+    return path
+
+
+def record_in_background(path, *args, **kwargs):
+    # Starts record_trajectory in another process; .result() waits for it and gives the path
+    pool = ProcessPoolExecutor(max_workers=1)
+    future = pool.submit(record_trajectory, path, *args, **kwargs)
+    pool.shutdown(wait=False)
+    return future
+
+
+def stream(mobject, path, sweeps_per_second=30):
+    # Adds an updater that shows frame int(t * sweeps_per_second) at time t,
+    # reading each frame from the memory-mapped file only when it is shown
+    frames = np.load(path, mmap_mode="r")
+    state = {"time": 0.0, "frame": -1}
+
+    def update(mob, dt):
+        state["time"] += dt
+        frame = min(int(state["time"] * sweeps_per_second), len(frames) - 1)
+        if frame != state["frame"]:
+            state["frame"] = frame
+            mob.set_spins(frames[frame])
+
+    mobject.add_updater(update)
+    update(mobject, 0)
+    return update, (len(frames) - 1) / sweeps_per_second
@@ -0,0 +1,110 @@
+from manim import *
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from tex_cache import GlyphCache
+
+
+# Content-addressed store of rendered animations, shared by every scene.
+#
+# manim already names each partial movie file after a hash of the play call
+# (camera, animations with their run_time, and every mobject on screen when
+# it starts) and skips rendering when that file exists. But it only looks in
+# the partial movie directory of one scene at one quality, and drops the
+# oldest files once there are more than max_files_cached (100). A long scene
+# has more plays than that, so across runs most of it is rendered again, and
+# another scene class with the same transitions never shares them.
+#
+# Here every partial movie that gets encoded is also linked into
+# media_dir/frame_cache under its play-call hash plus the output settings,
+# and a play that misses its own directory is looked up there before it is
+# rendered. Repeated transitions, in this run, an earlier run or another
+# scene, are encoded once. The store has its own size limit with
+# least-recently-used eviction, like the glyph cache.
+
+class FrameCache(GlyphCache):
+    name = "frame_cache"
+    format = 2
+
+    def __init__(self, directory=None, max_bytes=4 * 1024 * 1024 * 1024):
+        super().__init__(directory, max_bytes)
+
+    @property
+    def suffix(self):
+        return config.movie_file_extension
+
+    def key(self, hash_invocation):
+        digest = hashlib.sha256()
+        # Bumped when partial movies are encoded differently (static_hold)
+        digest.update(f"format {self.format}".encode())
+        digest.update(repr((
+            config.pixel_width, config.pixel_height, config.frame_rate,
+            str(config.background_color), config.background_opacity, config.transparent,
+        )).encode())
+        digest.update(hash_invocation.encode())
+        return digest.hexdigest()
+
+    def load(self, key, target):
+        path = self.path(key)
+        try:
+            # Touched first, as in GlyphCache.read; evicted by another process
+            # at any point before the link, it is just a miss
+            os.utime(path)
+            link(path, target)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key, source):
+        path = self.path(key)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        link(source, tmp)
+        self.commit(tmp, path)
+
+
+def link(source, target):
+    # Hard links cost nothing; copy across filesystems
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+frame_cache = FrameCache()
+
+
+def install(cache=frame_cache):
+    original_is_cached = SceneFileWriter.is_already_cached
+    if getattr(original_is_cached, "frame_cache", None) is not None:
+        return
+    original_end = SceneFileWriter.end_animation
+
+    def is_already_cached(self, hash_invocation):
+        if original_is_cached(self, hash_invocation):
+            return True
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return False
+        target = self.partial_movie_directory / f"{hash_invocation}{config.movie_file_extension}"
+        return cache.load(cache.key(hash_invocation), target)
+
+    def end_animation(self, allow_write=False):
+        original_end(self, allow_write)
+        if not (write_to_movie() and allow_write):
+            return
+        path = Path(self.partial_movie_file_path)
+        # With disable_caching the files are named by play number, not content
+        if not path.stem.startswith("uncached_"):
+            cache.store(cache.key(path.stem), path)
+
+    is_already_cached.frame_cache = cache
+    SceneFileWriter.is_already_cached = is_already_cached
+    SceneFileWriter.end_animation = end_animation
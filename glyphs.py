@@ -0,0 +1,30 @@
+from manim import *
+
+
+# Numbers that change while a scene plays, without compiling TeX each time.
+#
+# Every character a number can need is typeset once, in a single MathTex;
+# text() then lays out copies of those glyphs on a common baseline. Used by
+# LiveEquation and ConfigurationTable.
+
+NUMBER_GLYPHS = "0123456789+-.()"
+
+
+class GlyphSet:
+    def __init__(self, chars=NUMBER_GLYPHS, font_size=DEFAULT_FONT_SIZE):
+        line = MathTex(*chars, font_size=font_size)
+        reference = line[0].get_center()[1]
+        self.glyphs = dict(zip(chars, line))
+        # Height of each glyph relative to the first one, so copies keep one baseline
+        self.offsets = {char: glyph.get_center()[1] - reference for char, glyph in self.glyphs.items()}
+        self.buff = 0.05 * font_size / DEFAULT_FONT_SIZE
+
+    def text(self, string, color=WHITE):
+        # Starts at x = 0, with the first glyph of chars centred on y = 0
+        x, text = 0, VGroup()
+        for char in string:
+            glyph = self.glyphs[char].copy().set_color(color)
+            glyph.move_to([x + glyph.width / 2, self.offsets[char], 0])
+            x += glyph.width + self.buff
+            text.add(glyph)
+        return text
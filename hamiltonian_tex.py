@@ -0,0 +1,83 @@
+import re
+
+from manim import *
+
+import ising
+
+
+# The Hamiltonian of a coupling graph, H = sum_{i<j} s_i J_ij s_j, as one TeX
+# compile.
+#
+# MathTex("H", "=", "s_1", ...) compiles every substring on its own to find
+# where it starts, and arranging separate MathTex is one compile per piece.
+# Here the whole expression is a single SingleStringMathTex, and the glyph
+# range of each piece is counted from its TeX source instead: one glyph per
+# character and per command (\sum), none for braces, sub/superscript marks,
+# alignment and line breaks. The pieces stay addressable for colouring and
+# transforms:
+#
+#   formula.lhs             the left-hand side
+#   formula.terms[t]        term t, s_i J_ij s_j (the summand in sum form)
+#   formula.couplings[t]    its J_ij
+#   formula.term_ranges[t]  its (start, stop) glyph indices
+#
+# Indices are printed 1-based, as in the video, with commas once N > 9.
+
+
+def glyph_count(tex):
+    tex = re.sub(r"\\\\|&", "", tex)
+    tex = re.sub(r"\\[a-zA-Z]+", "#", tex)
+    return len(re.sub(r"[{}_^\s]", "", tex))
+
+
+class HamiltonianFormula(SingleStringMathTex):
+    def __init__(self, couplings, form="expanded", lhs="H", terms_per_line=None, h_color=None, j_color=None, **kwargs):
+        # couplings: a coupling matrix J, or the coupled pairs (i, j) with 0-based indices
+        if hasattr(couplings, "shape"):
+            rows, cols, _ = ising.coupled_pairs(couplings)
+            pairs = list(zip(rows.tolist(), cols.tolist()))
+        else:
+            pairs = [tuple(pair) for pair in couplings]
+        separator = "," if max(max(pair) for pair in pairs) >= 9 else ""
+
+        def index(*spins):
+            return separator.join(str(k + 1) for k in spins)
+
+        multiline = form == "expanded" and terms_per_line is not None and len(pairs) > terms_per_line
+        pieces = [(lhs, "lhs"), ("&=" if multiline else "=", "equals")]
+        if form == "sum":
+            pieces += [(r"\sum_{i<j}", "sum"), ("s_i", "spin"), ("J_{ij}", "coupling"), ("s_j", "spin")]
+        elif form == "expanded":
+            for t, (i, j) in enumerate(pairs):
+                if t:
+                    pieces.append((r"\\ &+" if multiline and t % terms_per_line == 0 else "+", "plus"))
+                pieces += [(f"s_{{{index(i)}}}", "spin"), (f"J_{{{index(i, j)}}}", "coupling"), (f"s_{{{index(j)}}}", "spin")]
+        else:
+            raise ValueError(f"Unknown form {form!r}, expected 'expanded' or 'sum'")
+
+        super().__init__(" ".join(tex for tex, _ in pieces), **kwargs)
+
+        self.piece_ranges = []
+        start = 0
+        for tex, role in pieces:
+            self.piece_ranges.append((role, start, start + glyph_count(tex)))
+            start += glyph_count(tex)
+        if start != len(self.submobjects):
+            logger.warning(f"HamiltonianFormula counted {start} glyphs in {self.tex_string!r}, TeX made {len(self.submobjects)}")
+
+        spins = [(a, b) for role, a, b in self.piece_ranges if role == "spin"]
+        coupling_ranges = [(a, b) for role, a, b in self.piece_ranges if role == "coupling"]
+        # A term runs from its first spin to its second
+        self.term_ranges = [(first[0], second[1]) for first, second in zip(spins[::2], spins[1::2])]
+        self.lhs = self.get_glyphs(*self.piece_ranges[0][1:])
+        self.terms = [self.get_glyphs(a, b) for a, b in self.term_ranges]
+        self.couplings = [self.get_glyphs(a, b) for a, b in coupling_ranges]
+
+        if h_color is not None:
+            self.lhs.set_color(h_color)
+        if j_color is not None:
+            for coupling in self.couplings:
+                coupling.set_color(j_color)
+
+    def get_glyphs(self, start, stop):
+        return VGroup(*self.submobjects[start:stop])
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+import numpy as np
+from scipy import io, sparse
+
+
+# Loads real coupling instances into the sparse form used by ising.py and
+# solver.py: an upper-triangular CSR matrix, one entry per coupled pair.
+#
+# Supported files:
+#   .mtx            Matrix Market, coordinate format, 1-based; in a general
+#                   matrix a pair given as both (i, j) and (j, i) is folded
+#                   to their mean, a pair given once keeps its weight
+#   G-set           first line "n m", then m lines "i j w", 1-based
+#   anything else   edge list, lines "i j [w]", 0-based, '#' comments, w = 1 if absent
+#
+# For max-cut instances the weights are the couplings (an antiferromagnet), so
+# the ground state is the maximum cut. In edge lists and G-set files an edge
+# listed twice (either direction) adds up.
+#
+# The text is parsed once with NumPy's C reader; the CSR arrays are then
+# written next to the file (<file>.csr/) and later loads memory-map them, so a
+# large instance is never turned into Python lists or held in memory twice.
+
+
+def load_instance(path, cache=True):
+    path = Path(path)
+    cache_dir = path.with_name(path.name + ".csr")
+    stamp = {"size": path.stat().st_size, "mtime": path.stat().st_mtime}
+
+    if cache and (cache_dir / "meta.json").exists():
+        meta = json.loads((cache_dir / "meta.json").read_text())
+        if meta["source"] == stamp:
+            return _load_csr(cache_dir, meta["n"])
+
+    J = parse_instance(path)
+    if cache:
+        _save_csr(cache_dir, J, stamp)
+        return _load_csr(cache_dir, J.shape[0])
+    return J
+
+
+def parse_instance(path):
+    path = Path(path)
+    if path.suffix == ".mtx":
+        symmetry = io.mminfo(path)[5]
+        J = sparse.coo_array(io.mmread(path))
+        if symmetry != "general":
+            # mmread mirrors symmetric files; keep each pair once
+            return sparse.triu(J, 1, format="csr")
+        n = J.shape[0]
+        # A pair given as both (i, j) and (j, i) is a full symmetric matrix
+        # entry, split over the two triangles: halve it, as ising.py folds
+        # J_ij and J_ji. A pair given in one direction only keeps its weight
+        pairs = np.minimum(J.row, J.col).astype(np.int64) * n + np.maximum(J.row, J.col)
+        both = np.intersect1d(pairs[J.row < J.col], pairs[J.row > J.col])
+        weights = np.where(np.isin(pairs, both), J.data / 2, J.data)
+        return _upper_csr(J.row, J.col, weights, n)
+
+    # The first line is read apart (it may be a G-set header), the rest in one
+    # pass of loadtxt
+    with open(path) as f:
+        header = f.readline().split("#")[0].split()
+        rows = np.loadtxt(f, comments="#", ndmin=2)
+    # G-set: a two-number "n m" header followed by exactly m weighted edges. A
+    # headerless unweighted edge list also starts with two numbers, but keeps
+    # two columns throughout
+    if len(header) == 2 and rows.shape == (int(float(header[1])), 3):
+        i, j = rows[:, 0].astype(np.int64) - 1, rows[:, 1].astype(np.int64) - 1
+        return _upper_csr(i, j, rows[:, 2], int(float(header[0])))
+
+    # Otherwise the first line is an edge like the others
+    edges = np.array([header], dtype=np.float64) if header else np.empty((0, rows.shape[1]))
+    edges = np.vstack([edges, rows]) if rows.size else edges
+    i, j = edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64)
+    weights = edges[:, 2] if edges.shape[1] > 2 else np.ones(len(edges))
+    return _upper_csr(i, j, weights, int(max(i.max(), j.max())) + 1)
+
+
+def _upper_csr(i, j, weights, n):
+    # Canonical (low, high) order so both directions of an edge land on the same entry
+    low, high = np.minimum(i, j), np.maximum(i, j)
+    keep = low != high
+    J = sparse.coo_array((weights[keep].astype(np.float64), (low[keep], high[keep])), shape=(n, n))
+    J = J.tocsr()
+    J.sum_duplicates()
+    return J
+
+
+def _save_csr(cache_dir, J, stamp):
+    cache_dir.mkdir(exist_ok=True)
+    # One index dtype for both arrays, so scipy takes them as they are
+    index_dtype = np.int32 if max(J.nnz, J.shape[0]) < 2**31 else np.int64
+    np.save(cache_dir / "indptr.npy", J.indptr.astype(index_dtype))
+    np.save(cache_dir / "indices.npy", J.indices.astype(index_dtype))
+    np.save(cache_dir / "data.npy", J.data)
+    (cache_dir / "meta.json").write_text(json.dumps({"n": J.shape[0], "source": stamp}))
+
+
+def _load_csr(cache_dir, n):
+    arrays = [np.load(cache_dir / f"{name}.npy", mmap_mode="r") for name in ("data", "indices", "indptr")]
+    return sparse.csr_array((arrays[0], arrays[1], arrays[2]), shape=(n, n), copy=False)
@@ -0,0 +1,186 @@
+import itertools
+import os
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+
+
+# Energies of Ising spin configurations, the one place the scene's H values
+# come from.
+#
+# Spins are +1/-1. A configuration is a row of an (M, N) int8 array, and the
+# couplings are an N x N matrix J, symmetric or upper triangular. Every pair
+# is counted once, as in the video:
+#
+#   H(s) = sum_{i<j} s_i J_ij s_j
+#
+# so for two people H = s_1 J_12 s_2. J may also be a scipy sparse matrix
+# (see instances.py), which is how large instances are kept.
+
+
+def coupling_matrix(n, couplings):
+    # couplings: {(i, j): J_ij} with 0-based indices
+    dtype = np.result_type(*couplings.values()) if couplings else np.int64
+    J = np.zeros((n, n), dtype=dtype)
+    for (i, j), value in couplings.items():
+        J[i, j] = J[j, i] = value
+    return J
+
+
+def all_configurations(n):
+    # All 2^n configurations in the scene's table order: +1 before -1, s_1 slowest
+    return np.array(list(itertools.product([1, -1], repeat=n)), dtype=np.int8)
+
+
+def upper_couplings(J):
+    # Each coupled pair once (i < j), keeping the matrix dense or sparse as given
+    if sparse.issparse(J):
+        J = J.tocsr()
+        # Already upper triangular (instances.py): used as it is, so a
+        # memory-mapped instance is never copied into RAM
+        rows = np.flatnonzero(np.diff(J.indptr))
+        if not len(rows) or (np.minimum.reduceat(J.indices, J.indptr[rows]) > rows).all():
+            return J
+        return sparse.triu(J, 1, format="csr")
+    return np.triu(np.asarray(J), 1)
+
+
+def coupled_pairs(J):
+    # (i, j, J_ij) of every coupled pair with i < j, as three arrays
+    upper = upper_couplings(J)
+    if sparse.issparse(upper):
+        upper = upper.tocoo()
+        return upper.row, upper.col, upper.data
+    rows, cols = np.nonzero(upper)
+    return rows, cols, upper[rows, cols]
+
+
+def symmetric_couplings(J):
+    # Both J_ij and J_ji filled in, zero diagonal
+    upper = upper_couplings(J)
+    return (upper + upper.T).tocsr() if sparse.issparse(upper) else upper + upper.T
+
+
+def energies(J, spins):
+    spins = np.atleast_2d(np.asarray(spins, dtype=np.int8))
+    # Keep integer couplings integer, so +1/-1 labels stay "+1", not "+1.0"
+    upper = upper_couplings(J)
+    s = spins.astype(upper.dtype if upper.dtype.kind == "f" else np.int64)
+    # (U^T s^T)^T rather than s @ U, which works for sparse U as well
+    return ((upper.T @ s.T).T * s).sum(axis=1)
+
+
+def energy(J, spins):
+    return energies(J, spins)[0]
+
+
+# --- Exhaustive enumeration -------------------------------------------------
+#
+# Walks all 2^N configurations in Gray-code order, where consecutive states
+# differ by one spin, so each energy is the previous one plus the single-flip
+#
+#   dE = -2 s_k h_k,   h_k = sum_j J_kj s_j
+#
+# which is O(N) per state instead of O(N^2). Each chunk of Gray-code steps is
+# done in one go with NumPy (every state in a chunk is known in closed form,
+# so the dE are computed side by side and summed with a cumsum), and chunks
+# are spread over a process pool for large N.
+#
+# Configuration index k follows all_configurations: bit N-1-i of k is spin i,
+# and a 0 bit means +1.
+
+Enumeration = namedtuple("Enumeration", "ground_energy ground_states degeneracy histogram")
+
+CHUNK_SIZE = 1 << 16
+
+
+def configurations_from_indices(indices, n):
+    indices = np.asarray(indices, dtype=np.int64)
+    bits = (indices[:, None] >> np.arange(n - 1, -1, -1)) & 1
+    return (1 - 2 * bits).astype(np.int8)
+
+
+def gray_code_energies(J, start, stop):
+    # Energies of Gray-code steps start..stop-1, and the configuration index of each step
+    J = np.asarray(J)
+    n = len(J)
+    full = symmetric_couplings(J)
+    steps = np.arange(start, stop, dtype=np.int64)
+    states = steps ^ (steps >> 1)
+
+    first = energies(J, configurations_from_indices(states[:1], n))
+    if len(steps) == 1:
+        return first, states
+
+    # Step t flips bit b = trailing zeros of t, i.e. spin n-1-b, of the state before it
+    previous = configurations_from_indices(states[:-1], n)
+    flipped = n - 1 - np.log2(steps[1:] & -steps[1:]).astype(np.intp)
+    fields = (previous * full[flipped]).sum(axis=1)
+    delta = -2 * previous[np.arange(len(flipped)), flipped] * fields
+    return np.concatenate([first, first + np.cumsum(delta)]), states
+
+
+def _enumerate_block(J, start, stop, bins, energy_range, max_states):
+    ground_energy, ground_states, degeneracy = np.inf, [], 0
+    histogram = Counter() if bins is None else np.zeros(bins, dtype=np.int64)
+    for chunk_start in range(start, stop, CHUNK_SIZE):
+        E, states = gray_code_energies(J, chunk_start, min(chunk_start + CHUNK_SIZE, stop))
+
+        if bins is None:
+            values, counts = np.unique(E, return_counts=True)
+            histogram.update(dict(zip(values.tolist(), counts.tolist())))
+        else:
+            histogram += np.histogram(E, bins=bins, range=energy_range)[0]
+
+        low = E.min()
+        if low < ground_energy and not np.isclose(low, ground_energy):
+            ground_energy, ground_states, degeneracy = low, [], 0
+        elif not np.isclose(low, ground_energy):
+            continue
+        at_ground = states[np.isclose(E, ground_energy)]
+        degeneracy += len(at_ground)
+        ground_states.extend(at_ground[:max_states - len(ground_states)].tolist())
+    return ground_energy, ground_states, degeneracy, histogram
+
+
+def enumerate_states(J, bins=None, max_states=1024, jobs=None):
+    # Exact ground states, degeneracy and density of states of all 2^N configurations.
+    # bins=None counts every distinct energy (integer couplings); otherwise the
+    # histogram has that many bins over the possible energy range.
+    # Only small N is feasible here, so sparse instances are simply densified.
+    J = J.toarray() if sparse.issparse(J) else np.asarray(J)
+    n = len(J)
+    if bins is None and J.dtype.kind == "f":
+        bins = 256
+    bound = float(np.abs(upper_couplings(J)).sum())
+    energy_range = (-bound, bound) if bound > 0 else (-1.0, 1.0)
+
+    total = 1 << n
+    if total <= 4 * CHUNK_SIZE:
+        blocks = [_enumerate_block(J, 0, total, bins, energy_range, max_states)]
+    else:
+        jobs = jobs or os.cpu_count()
+        edges = np.linspace(0, total, 4 * jobs + 1).astype(np.int64)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            blocks = list(pool.map(
+                _enumerate_block, itertools.repeat(J), edges[:-1].tolist(), edges[1:].tolist(),
+                itertools.repeat(bins), itertools.repeat(energy_range), itertools.repeat(max_states),
+            ))
+
+    ground_energy = min(block[0] for block in blocks)
+    ground_states, degeneracy = [], 0
+    histogram = Counter() if bins is None else np.zeros(bins, dtype=np.int64)
+    for block_energy, block_states, block_degeneracy, block_histogram in blocks:
+        histogram += block_histogram
+        if np.isclose(block_energy, ground_energy):
+            degeneracy += block_degeneracy
+            ground_states.extend(block_states[:max_states - len(ground_states)])
+
+    if bins is None:
+        values = np.array(sorted(histogram))
+        histogram = (values, np.array([histogram[v] for v in values.tolist()]))
+    else:
+        histogram = (np.linspace(*energy_range, bins + 1), histogram)
+    return Enumeration(ground_energy, np.sort(ground_states), degeneracy, histogram)
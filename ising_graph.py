@@ -0,0 +1,160 @@
+from manim import *
+
+import ising
+import label_layout
+
+
+# A whole Ising graph as a handful of mobjects, however many people it has.
+#
+# create_person/create_connection make a Circle + Text per person and a Line +
+# MathTex + background per pair, so the mobject count grows as O(N^2). Here
+# all edges of one style (colour, width) are the subpaths of a single
+# VMobject, and all nodes of one colour likewise, so the family that every
+# frame walks stays at a few mobjects. Cairo strokes a VMobject in one
+# colour, so "per-segment" colour and width mean one VMobject per style
+# bucket: sign of J_ij for the colour, |J_ij| in a few levels for the width.
+#
+# Names and J_ij labels are real Text/MathTex and are optional. Unless
+# name_directions / label_alphas are given, label_layout places them so they
+# keep clear of the nodes and of each other.
+
+class IsingGraph(VGroup):
+    def __init__(
+        self,
+        positions,
+        J,
+        names=None,
+        name_directions=None,
+        name_font_size=36,
+        spins=None,
+        node_radius=0.3,
+        node_opacity=0.8,
+        node_color=WHITE,
+        plus_color=BLUE_D,
+        minus_color=RED_D,
+        edge_color=TEAL,
+        edge_width=3,
+        cozy_color=None,
+        tense_color=None,
+        width_levels=1,
+        edge_labels=False,
+        label_color=YELLOW,
+        label_alphas=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        positions = np.array(positions, dtype=float)
+        self.node_radius = node_radius
+
+        rows, cols, values = ising.coupled_pairs(J)
+        self.pairs = np.column_stack([rows, cols])
+        self.couplings = values
+
+        self.edges = self.build_edges(
+            positions, edge_color, edge_width, cozy_color, tense_color, width_levels
+        )
+
+        # One circle outline, copied to every node in a single broadcast
+        template = Circle(radius=node_radius).points
+        shapes = template[None] + positions[:, None]
+        self.nodes = VGroup(*[
+            VMobject(fill_color=color, fill_opacity=node_opacity, stroke_color=color)
+            for color in (node_color, plus_color, minus_color)
+        ])
+        for bucket in self.nodes:
+            bucket.node_indices = np.array([], dtype=int)
+        self.nodes[0].node_indices = np.arange(len(positions))
+        self.nodes[0].set_points(shapes.reshape(-1, 3))
+        if spins is not None:
+            self.set_spins(spins)
+
+        index = label_layout.GridIndex(cell_size=4 * node_radius)
+        label_layout.add_nodes(index, positions, node_radius)
+
+        self.names = VGroup()
+        if names is not None:
+            texts = [Text(name, font_size=name_font_size) for name in names]
+            sizes = [(text.width + 0.1, text.height + 0.1) for text in texts]
+            if name_directions is None:
+                name_directions = label_layout.place_node_labels(index, positions, sizes, node_radius + 0.2)
+            else:
+                # Still in the index, so the edge labels keep clear of them
+                for position, direction, size in zip(positions, name_directions, sizes):
+                    index.insert(label_layout.node_label_box(position, direction, size, node_radius + 0.2))
+            for text, direction, position in zip(texts, name_directions, positions):
+                text.next_to(position + direction * node_radius, direction, buff=0.2)
+                # Drawn on top of the edges, with a background to avoid overlap
+                text.set_z_index(2)
+                text.add_background_rectangle(opacity=1, buff=0.05)
+                self.names.add(text)
+
+        self.labels = VGroup()
+        if edge_labels:
+            endpoints = self.edge_endpoints(positions)
+            labels = [MathTex(f"J_{{{i + 1}{j + 1}}}", color=label_color).scale(1.2) for i, j in self.pairs]
+            if label_alphas is None:
+                sizes = [(label.width + 0.2, label.height + 0.2) for label in labels]
+                alphas = label_layout.place_edge_labels(index, endpoints, sizes)
+            else:
+                alphas = [label_alphas.get((i, j), 0.5) for i, j in self.pairs]
+            for label, alpha, (start, end) in zip(labels, alphas, endpoints):
+                label.move_to(start + alpha * (end - start))
+                angle = angle_of_vector(end - start)
+                label.rotate(angle)
+                if (PI / 2) < abs(angle) < (3 * PI / 2):
+                    label.rotate(PI)
+                label.add_background_rectangle(opacity=1, buff=0.1)
+                self.labels.add(label)
+
+        self.add(self.edges, self.nodes, self.names, self.labels)
+
+    def edge_endpoints(self, positions):
+        # Edges stop at the node outlines, like create_connection
+        starts, ends = positions[self.pairs[:, 0]], positions[self.pairs[:, 1]]
+        units = (ends - starts) / np.linalg.norm(ends - starts, axis=1, keepdims=True)
+        return np.stack([starts + units * self.node_radius, ends - units * self.node_radius], axis=1)
+
+    def build_edges(self, positions, edge_color, edge_width, cozy_color, tense_color, width_levels):
+        endpoints = self.edge_endpoints(positions)
+        # Straight cubic Bezier segments: anchors at the ends, handles at thirds
+        t = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+        curves = endpoints[:, :1] + t * (endpoints[:, 1:] - endpoints[:, :1])
+
+        colors = np.full(len(self.pairs), 0)
+        if cozy_color is not None:
+            colors[self.couplings < 0] = 1
+        if tense_color is not None:
+            colors[self.couplings > 0] = 2
+        palette = [edge_color, cozy_color, tense_color]
+
+        strength = np.abs(self.couplings)
+        levels = np.zeros(len(self.pairs), dtype=int)
+        if width_levels > 1 and strength.max() > 0:
+            levels = np.minimum((strength / strength.max() * width_levels).astype(int), width_levels - 1)
+
+        edges = VGroup()
+        for color, level in sorted(set(zip(colors.tolist(), levels.tolist()))):
+            mask = (colors == color) & (levels == level)
+            edge = VMobject(
+                stroke_color=palette[color],
+                stroke_width=edge_width * (level + 1) / width_levels if width_levels > 1 else edge_width,
+            )
+            edge.set_points(curves[mask].reshape(-1, 3))
+            edges.add(edge)
+        # Behind the nodes, as in create_connection
+        edges.set_z_index(-1)
+        return edges
+
+    def set_spins(self, spins):
+        # Regroup the node outlines, wherever the graph has been moved to, by spin colour
+        filled = [bucket for bucket in self.nodes if len(bucket.node_indices)]
+        k = len(filled[0].points) // len(filled[0].node_indices)
+        shapes = np.empty((sum(len(bucket.node_indices) for bucket in filled), k, 3))
+        for bucket in filled:
+            shapes[bucket.node_indices] = bucket.points.reshape(-1, k, 3)
+
+        spins = np.asarray(spins)
+        for bucket, value in zip(self.nodes, (0, 1, -1)):
+            bucket.node_indices = np.flatnonzero(spins == value)
+            bucket.set_points(shapes[bucket.node_indices].reshape(-1, 3))
+        return self
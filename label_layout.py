@@ -0,0 +1,194 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+
+
+# Automatic placement of edge labels (J_ij) and node labels (names), so
+# bigger graphs don't need hand-tuned label_pos_alpha offsets.
+#
+# Everything already on the canvas (node circles, placed labels) is an
+# axis-aligned box (x0, y0, x1, y1) in a uniform grid. A candidate position
+# only checks the boxes in the grid cells it covers, so placing n labels is
+# about O(n) rather than comparing every pair. Labels are placed greedily:
+# each takes its first candidate that overlaps nothing, or the one that
+# overlaps least when every candidate is taken, and is then added to the grid.
+#
+# A label turned along a diagonal edge is a rotated rectangle, and its
+# axis-aligned bounding box is much bigger than the label. Those labels also
+# carry their four corners: the box finds the neighbours in the grid, and
+# the overlap is measured between the actual shapes.
+
+# Candidate positions along an edge, from the middle outwards
+EDGE_ALPHAS = (0.5, 0.4, 0.6, 0.3, 0.7, 0.2, 0.8)
+
+# Candidate sides of a node: below, above, right, left
+NODE_DIRECTIONS = np.array([[0, -1, 0], [0, 1, 0], [1, 0, 0], [-1, 0, 0]], dtype=float)
+
+
+class GridIndex:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.boxes = []
+        self.shapes = []
+
+    def cells_of(self, box):
+        x0, y0, x1, y1 = (math.floor(v / self.cell_size) for v in box)
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    def insert(self, box, corners=None):
+        # corners: the shape inside the box, counter-clockwise, if it isn't the box itself
+        self.boxes.append(box)
+        self.shapes.append(corners)
+        for cell in self.cells_of(box):
+            self.cells[cell].append(len(self.boxes) - 1)
+
+    def overlapping(self, box, corners=None):
+        # (index, shared area) of every shape already in the grid that this one overlaps
+        seen = set()
+        for cell in self.cells_of(box):
+            for k in self.cells.get(cell, ()):
+                if k in seen:
+                    continue
+                seen.add(k)
+                other = self.boxes[k]
+                w = min(box[2], other[2]) - max(box[0], other[0])
+                h = min(box[3], other[3]) - max(box[1], other[1])
+                if w <= 0 or h <= 0:
+                    continue
+                if corners is not None or self.shapes[k] is not None:
+                    area = polygon_area(clip(
+                        box_corners(box) if corners is None else corners,
+                        box_corners(other) if self.shapes[k] is None else self.shapes[k],
+                    ))
+                    if area > 1e-9:
+                        yield k, area
+                else:
+                    yield k, w * h
+
+    def overlap(self, box, corners=None):
+        # Total area shared with the shapes already in the grid
+        return sum(area for _, area in self.overlapping(box, corners))
+
+
+def contains(box, other):
+    return box[0] <= other[0] and box[1] <= other[1] and other[2] <= box[2] and other[3] <= box[3]
+
+
+def partial_overlaps(boxes, cell_size=1.0):
+    # (i, j, shared area) of every pair of boxes that overlap without one
+    # being inside the other (an arrow in its circle is composition, not a clash)
+    index = GridIndex(cell_size)
+    for i, box in enumerate(boxes):
+        for j, area in index.overlapping(box):
+            if not contains(box, boxes[j]) and not contains(boxes[j], box):
+                yield j, i, area
+        index.insert(box)
+
+
+def overflow(box, x_radius, y_radius):
+    # How far the box sticks out of a frame centred on the origin (<= 0 inside)
+    return max(-x_radius - box[0], -y_radius - box[1], box[2] - x_radius, box[3] - y_radius)
+
+
+def box_corners(box):
+    x0, y0, x1, y1 = box
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+
+def clip(subject, clipper):
+    # Sutherland-Hodgman: the part of convex polygon subject inside convex
+    # polygon clipper, both counter-clockwise lists of (x, y)
+    output = list(subject)
+    for (ax, ay), (bx, by) in zip(clipper, clipper[1:] + clipper[:1]):
+        if not output:
+            break
+        points, output = output, []
+
+        def side(p):
+            return (bx - ax) * (p[1] - ay) - (by - ay) * (p[0] - ax)
+
+        for p, q in zip(points, points[1:] + points[:1]):
+            sp, sq = side(p), side(q)
+            if sp >= 0:
+                output.append(p)
+            if (sp >= 0) != (sq >= 0):
+                t = sp / (sp - sq)
+                output.append((p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1])))
+    return output
+
+
+def polygon_area(points):
+    if len(points) < 3:
+        return 0.0
+    return abs(sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]))) / 2
+
+
+def box_around(center, width, height):
+    return (
+        float(center[0] - width / 2), float(center[1] - height / 2),
+        float(center[0] + width / 2), float(center[1] + height / 2),
+    )
+
+
+def place(index, candidates, shapes=None):
+    # candidates: boxes in order of preference, shapes: the corners inside
+    # each box (or None); returns the index of the chosen one
+    shapes = shapes or [None] * len(candidates)
+    best, best_overlap = 0, math.inf
+    for k, (box, corners) in enumerate(zip(candidates, shapes)):
+        overlap = index.overlap(box, corners)
+        if overlap < best_overlap:
+            best, best_overlap = k, overlap
+        if overlap == 0:
+            break
+    index.insert(candidates[best], shapes[best])
+    return best
+
+
+def add_nodes(index, positions, radius):
+    for position in positions:
+        index.insert(box_around(position, 2 * radius, 2 * radius))
+
+
+def node_label_box(position, direction, size, offset):
+    # Same spot as label.next_to(node, direction, buff) for a node of radius + buff = offset
+    width, height = size
+    center = position + direction * offset + direction * np.array([width / 2, height / 2, 0])
+    return box_around(center, width, height)
+
+
+def place_node_labels(index, positions, sizes, offset, directions=NODE_DIRECTIONS):
+    # sizes: (width, height) of each label; returns the side each label goes on
+    chosen = []
+    for position, size in zip(positions, sizes):
+        k = place(index, [node_label_box(position, d, size, offset) for d in directions])
+        chosen.append(directions[k])
+    return np.array(chosen)
+
+
+def place_edge_labels(index, endpoints, sizes, alphas=EDGE_ALPHAS):
+    # endpoints: (E, 2, 3) start and end of each edge; sizes: (width, height)
+    # of each label before it is turned along its edge. Returns the alpha of
+    # each label along its edge.
+    endpoints = np.asarray(endpoints, dtype=float)
+    sizes = np.asarray(sizes, dtype=float)
+    chosen = np.empty(len(endpoints))
+    for e, (start, end) in enumerate(endpoints):
+        # Half the label along the edge, half across it
+        along = (end - start)[:2] / np.linalg.norm((end - start)[:2])
+        across = np.array([-along[1], along[0]])
+        offsets = [
+            sx * sizes[e, 0] / 2 * along + sy * sizes[e, 1] / 2 * across
+            for sx, sy in ((-1, -1), (1, -1), (1, 1), (-1, 1))
+        ]
+        candidates, shapes = [], []
+        for a in alphas:
+            center = (start + a * (end - start))[:2]
+            corners = [tuple(map(float, center + offset)) for offset in offsets]
+            xs, ys = zip(*corners)
+            candidates.append((min(xs), min(ys), max(xs), max(ys)))
+            shapes.append(corners)
+        chosen[e] = alphas[place(index, candidates, shapes)]
+    return chosen
@@ -0,0 +1,31 @@
+from manim import *
+
+
+# An L x L spin lattice drawn as a single image, one pixel per spin.
+#
+# A Circle + Arrow per spin stops scaling after a few dozen people; a 512 x 512
+# lattice would be a quarter of a million mobjects. Here the whole lattice is
+# one ImageMobject whose pixel array is the spin array looked up in a
+# two-colour palette (-1 -> minus_color, +1 -> plus_color). set_spins writes
+# the new colours straight into the same pixel buffer, so an updater can
+# change every spin each frame without allocating. Nearest-neighbour
+# resampling keeps every spin a sharp square however large it is drawn.
+
+class SpinLattice(ImageMobject):
+    def __init__(self, spins, plus_color=BLUE_D, minus_color=RED_D, height=4, **kwargs):
+        spins = np.asarray(spins)
+        self.palette = np.array([color_to_int_rgba(minus_color), color_to_int_rgba(plus_color)], dtype=np.uint8)
+        # Reused by set_spins, as is the pixel array itself
+        self.plus = spins > 0
+        super().__init__(
+            self.palette[self.plus.view(np.uint8)],
+            resampling_algorithm=RESAMPLING_ALGORITHMS["nearest"],
+            **kwargs,
+        )
+        self.scale_to_fit_height(height)
+
+    def set_spins(self, spins):
+        np.greater(spins, 0, out=self.plus)
+        # mode="clip" lets take write into the buffer directly instead of via a copy
+        np.take(self.palette, self.plus.view(np.uint8), axis=0, out=self.pixel_array, mode="clip")
+        return self
@@ -0,0 +1,110 @@
+import math
+
+import numpy as np
+
+import ising
+
+
+# Node positions computed from the coupling matrix instead of typed in by
+# hand, for graphs bigger than the triangle and the square.
+#
+# A force-directed (Fruchterman-Reingold) layout: every pair of people pushes
+# apart, cozy pairs (J_ij < 0) pull together like springs and tense pairs
+# (J_ij > 0) push apart a little more, and a weak pull towards the middle
+# keeps separate groups on screen. The step size cools down linearly.
+#
+# The all-pairs push is the O(N^2) part, so it is approximated Barnes-Hut
+# style on a quadtree that is never built as objects: level l is a 2^l x 2^l
+# grid whose cell masses and centres of mass come from np.bincount. All
+# (node, cell) pairs of one level are tested at once; a cell far enough away
+# (size / distance < theta) acts as one body, the others are opened into their
+# four children on the next level, and near cells left at the leaves are
+# summed node against node. Edge forces are one vectorized pass over the
+# coupled pairs, so an iteration is O(N log N + edges).
+#
+# The result is an (N, 3) array of scene points, scaled to fit width x height
+# around the origin, ready for create_person or IsingGraph.
+
+
+def accumulate(force, nodes, push):
+    # force[nodes] += push, with repeated nodes adding up
+    for k in (0, 1):
+        force[:, k] += np.bincount(nodes, weights=push[:, k], minlength=len(force))
+
+
+def repulsion(pos, theta):
+    n = len(pos)
+    low = pos.min(axis=0)
+    size = max(float((pos.max(axis=0) - low).max()), 1e-9) * (1 + 1e-9)
+    # Deep enough for a few nodes per leaf
+    depth = max(1, math.ceil(math.log(n / 4, 4)))
+    leaf = np.minimum(((pos - low) / size * (1 << depth)).astype(np.int64), (1 << depth) - 1)
+
+    force = np.zeros_like(pos)
+    nodes, cells = np.arange(n), np.zeros(n, dtype=np.int64)
+    for level in range(depth + 1):
+        side = 1 << level
+        own = leaf >> (depth - level)
+        own_cell = own[:, 0] * side + own[:, 1]
+        mass = np.bincount(own_cell, minlength=side * side)
+        centre = np.stack([np.bincount(own_cell, weights=pos[:, k], minlength=side * side) for k in (0, 1)], axis=1)
+
+        keep = mass[cells] > 0
+        nodes, cells = nodes[keep], cells[keep]
+        m = mass[cells]
+        delta = pos[nodes] - centre[cells] / m[:, None]
+        dist2 = np.maximum((delta ** 2).sum(axis=1), 1e-9)
+        far = (own_cell[nodes] != cells) & (size / side < theta * np.sqrt(dist2))
+        accumulate(force, nodes[far], (m / dist2)[far, None] * delta[far])
+        nodes, cells = nodes[~far], cells[~far]
+        if level == depth:
+            break
+        # Open the near cells into their four children
+        x, y = cells // side, cells % side
+        nodes = np.repeat(nodes, 4)
+        cells = ((2 * x[:, None] + [0, 0, 1, 1]) * 2 * side + 2 * y[:, None] + [0, 1, 0, 1]).ravel()
+
+    # Near leaves: node against node, exactly
+    order = np.argsort(own_cell, kind="stable")
+    starts = np.searchsorted(own_cell[order], cells)
+    counts = mass[cells]
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    others = order[np.repeat(starts, counts) + np.arange(counts.sum()) - first]
+    nodes = np.repeat(nodes, counts)
+    keep = nodes != others
+    nodes, others = nodes[keep], others[keep]
+    delta = pos[nodes] - pos[others]
+    dist2 = np.maximum((delta ** 2).sum(axis=1), 1e-9)
+    accumulate(force, nodes, delta / dist2[:, None])
+    return force
+
+
+def force_layout(J, iterations=50, width=10.0, height=6.0, theta=1.2, gravity=0.05, seed=0):
+    rows, cols, values = ising.coupled_pairs(J)
+    n = J.shape[0]
+    strength = np.abs(values.astype(float))
+    cozy = values < 0
+
+    # Unit area per node, so the ideal edge length k is 1
+    pos = np.random.default_rng(seed).uniform(-0.5, 0.5, (n, 2)) * math.sqrt(n)
+    step = math.sqrt(n) / 10
+    for t in range(iterations):
+        force = repulsion(pos, theta)
+
+        delta = pos[rows] - pos[cols]
+        dist = np.maximum(np.linalg.norm(delta, axis=1), 1e-9)
+        # Cozy pairs attract (d^2 / k), tense pairs repel (k^2 / d), scaled by |J_ij|
+        magnitude = np.where(cozy, -dist ** 2, 1 / dist) * strength
+        pull = (magnitude / dist)[:, None] * delta
+        accumulate(force, rows, pull)
+        accumulate(force, cols, -pull)
+        force -= gravity * pos
+
+        # Move along the force, never more than the current temperature
+        norm = np.maximum(np.linalg.norm(force, axis=1, keepdims=True), 1e-9)
+        pos += force / norm * np.minimum(norm, step * (1 - t / iterations))
+
+    pos -= (pos.max(axis=0) + pos.min(axis=0)) / 2
+    extent = np.maximum(pos.max(axis=0) - pos.min(axis=0), 1e-9)
+    pos *= min(width / extent[0], height / extent[1])
+    return np.column_stack([pos, np.zeros(n)])
@@ -0,0 +1,91 @@
+from manim import *
+
+from glyphs import GlyphSet
+
+
+# The live "H = (s_1) x (J) x (s_2) = H" readout of the two-person demo,
+# driven by three ValueTrackers instead of a new MathTex per step.
+#
+# Everything is typeset once: the fixed parts (H, =, x) in a template
+# equation, and every glyph a number can need in a GlyphSet. When a tracker
+# moves, only the number slots whose text changed are refilled with copies of
+# those glyphs and the row is re-spaced, so stepping through values needs no
+# TeX and no whole-formula point alignment. Spin slots show the sign of their
+# tracker, so animating a spin tracker from +1 to -1 flips the readout halfway
+# while H = s_1 J s_2 (and anything following get_h) moves smoothly.
+#
+# Glyphs are copied at the font size given here, so move the equation
+# freely but set its size with font_size rather than .scale().
+
+
+class LiveEquation(VGroup):
+    def __init__(
+        self,
+        s1=1,
+        j=1,
+        s2=1,
+        decimals=0,
+        font_size=DEFAULT_FONT_SIZE,
+        h_color=GREEN,
+        j_color=YELLOW,
+        plus_color=BLUE_D,
+        minus_color=RED_D,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.s1, self.j, self.s2 = ValueTracker(s1), ValueTracker(j), ValueTracker(s2)
+        self.decimals = decimals
+        self.j_color, self.h_color = j_color, h_color
+        self.plus_color, self.minus_color = plus_color, minus_color
+
+        self.glyphs = GlyphSet(font_size=font_size)
+        template = MathTex("H", "=", "(+1)", r"\times", "(+1)", r"\times", "(+1)", "=", "+1", font_size=font_size)
+        template[0].set_color(h_color)
+        self.gaps = [template[k + 1].get_left()[0] - template[k].get_right()[0] for k in range(len(template) - 1)]
+        # Glyph heights are kept relative to the fixed "H", which is never replaced
+        self.anchor = template[2][0].get_center()[1] - template[0].get_center()[1] - self.glyphs.offsets["("]
+        self.slot_indices = (2, 4, 6, 8)
+        self.texts = [None] * len(self.slot_indices)
+        for k in self.slot_indices:
+            template.submobjects[k] = VGroup()
+        self.add(*template.submobjects)
+
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    def get_h(self):
+        # H = s_1 J_12 s_2, one pair as in ising.energy
+        return self.s1.get_value() * self.j.get_value() * self.s2.get_value()
+
+    def format_number(self, value):
+        # + 0.0 turns a rounded -0 into 0
+        return f"{round(value, self.decimals) + 0.0:+.{self.decimals}f}"
+
+    def slot_contents(self):
+        s1 = 1 if self.s1.get_value() > 0 else -1
+        s2 = 1 if self.s2.get_value() > 0 else -1
+        return [
+            (f"({s1:+})", self.plus_color if s1 > 0 else self.minus_color),
+            (f"({self.format_number(self.j.get_value())})", self.j_color),
+            (f"({s2:+})", self.plus_color if s2 > 0 else self.minus_color),
+            (self.format_number(self.get_h()), self.h_color),
+        ]
+
+    def refresh(self):
+        changed = False
+        for n, (k, content) in enumerate(zip(self.slot_indices, self.slot_contents())):
+            if content == self.texts[n]:
+                continue
+            self.texts[n] = content
+            text, color = content
+            y = self.submobjects[0].get_center()[1] + self.anchor
+            self.submobjects[k].submobjects = self.glyphs.text(text, color).shift(y * UP).submobjects
+            changed = True
+
+        if changed:
+            # Re-space the row from its left edge with the template's gaps
+            x = self.submobjects[0].get_left()[0]
+            for part, gap in zip(self.submobjects, self.gaps + [0]):
+                part.shift((x - part.get_left()[0]) * RIGHT)
+                x = part.get_right()[0] + gap
+        return self
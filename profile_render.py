@@ -0,0 +1,258 @@
+import argparse
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import *
+from manim.mobject.text import tex_mobject
+from manim.utils import tex_file_writing
+
+import tex_cache
+from render_parallel import QUALITIES, load_scene
+
+
+# Where does a render spend its time?
+#
+#   python profile_render.py Introduction.py Introduction -q l -o render_profile
+#
+# renders the scene once with every play/wait, every mobject constructor, TeX
+# compile, frame write and the final combine wrapped in a timer, and writes
+#
+#   render_profile.json    one record per play/wait call: segment, animations,
+#                          wall time, frames written, live mobjects and points
+#                          afterwards, and the cache traffic during the call
+#                          (TeX snippets requested / compiled, glyph and text
+#                          layout cache hits / misses, whether manim's movie
+#                          cache was hit),
+#                          plus totals per segment and per mobject class
+#   render_profile.folded  "Introduction;segment:intro;play(Write);MathTex 1234"
+#                          lines of exclusive microseconds, for flamegraph.pl,
+#                          inferno or speedscope
+#
+# Only the main thread is timed. The scene is not prewarmed (tex_prewarm), so
+# with a cold TeX cache every compile shows up in the frame that needed it;
+# run tex_prewarm.py first to profile the render alone.
+
+class RenderProfiler:
+    def __init__(self, root):
+        self.stack = [root]
+        self.child_time = [0.0]
+        self.folded = defaultdict(float)
+        self.constructors = defaultdict(lambda: {"count": 0, "wall": 0.0})
+        self.counters = defaultdict(int)
+        self.calls = []
+        self.segment = "construct"
+        self.patches = []
+        self.constructing = set()
+
+    @contextmanager
+    def frame(self, name):
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        self.stack.append(name)
+        self.child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            # Exclusive time: flamegraph tools add the children back up
+            self.folded[";".join(self.stack)] += elapsed - self.child_time.pop()
+            self.stack.pop()
+            self.child_time[-1] += elapsed
+
+    def patch(self, owner, name, wrapper):
+        original = getattr(owner, name)
+        self.patches.append((owner, name, original, name in vars(owner)))
+        setattr(owner, name, wrapper(original))
+
+    def timed(self, name):
+        def wrapper(original):
+            def timed_call(*args, **kwargs):
+                with self.frame(name):
+                    return original(*args, **kwargs)
+            return timed_call
+        return wrapper
+
+    def counted(self, counter):
+        def wrapper(original):
+            def counted_call(*args, **kwargs):
+                self.counters[counter] += 1
+                return original(*args, **kwargs)
+            return counted_call
+        return wrapper
+
+    def install(self):
+        # Class-level hooks: every mobject constructor and the TeX pipeline
+        for cls in self.mobject_classes():
+            self.patch(cls, "__init__", self.constructor(cls))
+        self.patch(tex_mobject, "tex_to_svg_file", self.counted("tex_requests"))
+        self.patch(tex_file_writing, "compile_tex", self.counted("tex_compiles"))
+        self.patch(tex_file_writing, "compile_tex", self.timed("compile_tex"))
+        self.patch(tex_file_writing, "convert_to_svg", self.timed("convert_to_svg"))
+
+    def uninstall(self):
+        for owner, name, original, own in reversed(self.patches):
+            if own:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
+        self.patches = []
+
+    def mobject_classes(self):
+        classes, pending = [], [Mobject]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if "__init__" in vars(cls):
+                classes.append(cls)
+        return classes
+
+    def constructor(self, cls):
+        def wrapper(original):
+            def __init__(mob, *args, **kwargs):
+                # Only the outermost __init__ of an object is timed, not its super() chain
+                if id(mob) in self.constructing:
+                    return original(mob, *args, **kwargs)
+                self.constructing.add(id(mob))
+                start = time.perf_counter()
+                try:
+                    with self.frame(type(mob).__name__):
+                        return original(mob, *args, **kwargs)
+                finally:
+                    self.constructing.discard(id(mob))
+                    stats = self.constructors[type(mob).__name__]
+                    stats["count"] += 1
+                    stats["wall"] += time.perf_counter() - start
+            return __init__
+        return wrapper
+
+    def attach(self, scene):
+        # Instance-level hooks on this scene, its renderer and its file writer
+        renderer, file_writer = scene.renderer, scene.renderer.file_writer
+        self.patch(scene, "play", self.play_wrapper(scene))
+        self.patch(scene, "setup", self.timed("setup"))
+        if hasattr(scene, "play_segment"):
+            self.patch(scene, "play_segment", self.segment_wrapper)
+        self.patch(renderer, "add_frame", self.frame_counter(renderer))
+        self.patch(file_writer, "write_frame", self.timed("write_frame"))
+        self.patch(file_writer, "is_already_cached", self.cache_probe)
+        self.patch(file_writer, "combine_to_movie", self.timed("combine_to_movie"))
+
+    def segment_wrapper(self, original):
+        def play_segment(name):
+            self.segment = name
+            with self.frame(f"segment:{name}"):
+                return original(name)
+        return play_segment
+
+    def frame_counter(self, renderer):
+        def wrapper(original):
+            def add_frame(frame, num_frames=1):
+                if not renderer.skip_animations:
+                    self.counters["frames"] += num_frames
+                return original(frame, num_frames)
+            return add_frame
+        return wrapper
+
+    def cache_probe(self, original):
+        def is_already_cached(hash_invocation):
+            hit = original(hash_invocation)
+            self.counters["movie_cache_hits" if hit else "movie_cache_misses"] += 1
+            return hit
+        return is_already_cached
+
+    def snapshot(self):
+        counters = dict(self.counters)
+        counters["glyph_cache_hits"] = tex_cache.glyph_cache.hits
+        counters["glyph_cache_misses"] = tex_cache.glyph_cache.misses
+        counters["layout_cache_hits"] = tex_cache.layout_cache.hits
+        counters["layout_cache_misses"] = tex_cache.layout_cache.misses
+        return counters
+
+    def play_wrapper(self, scene):
+        def wrapper(original):
+            def play(*args, **kwargs):
+                names = [type(anim).__name__ for anim in args]
+                kind = "wait" if names == ["Wait"] else "play"
+                before = self.snapshot()
+                start = time.perf_counter()
+                with self.frame("wait" if kind == "wait" else f"play({','.join(names)})"):
+                    result = original(*args, **kwargs)
+                wall = time.perf_counter() - start
+                after = self.snapshot()
+
+                family = scene.get_mobject_family_members()
+                record = {
+                    "segment": self.segment,
+                    "index": len(self.calls),
+                    "kind": kind,
+                    "animations": names,
+                    "wall": wall,
+                    "mobjects": len(family),
+                    "points": sum(len(mob.points) for mob in family),
+                }
+                for counter in ("frames", "tex_requests", "tex_compiles", "glyph_cache_hits",
+                                "glyph_cache_misses", "layout_cache_hits", "layout_cache_misses",
+                                "movie_cache_hits", "movie_cache_misses"):
+                    record[counter] = after.get(counter, 0) - before.get(counter, 0)
+                self.calls.append(record)
+                return result
+            return play
+        return wrapper
+
+    def summary(self):
+        segments = {}
+        for call in self.calls:
+            totals = segments.setdefault(call["segment"], {"calls": 0, "wall": 0.0, "frames": 0, "tex_compiles": 0})
+            totals["calls"] += 1
+            for key in ("wall", "frames", "tex_compiles"):
+                totals[key] += call[key]
+        return {
+            "calls": self.calls,
+            "segments": segments,
+            "constructors": dict(sorted(self.constructors.items(), key=lambda item: -item[1]["wall"])),
+            "totals": self.snapshot(),
+        }
+
+    def write(self, output):
+        output = Path(output)
+        output.with_suffix(".json").write_text(json.dumps(self.summary(), indent=2))
+        output.with_suffix(".folded").write_text(
+            "".join(f"{stack} {round(seconds * 1e6)}\n" for stack, seconds in self.folded.items() if seconds > 0)
+        )
+        return output.with_suffix(".json"), output.with_suffix(".folded")
+
+
+def profile_render(scene_file, scene_name, quality="low_quality", output="render_profile"):
+    scene_cls = load_scene(scene_file, scene_name)
+    profiler = RenderProfiler(scene_name)
+    profiler.install()
+    try:
+        with tempconfig({"quality": quality}):
+            scene = scene_cls()
+            profiler.attach(scene)
+            scene.render()
+    finally:
+        profiler.uninstall()
+    return profiler.write(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a scene once and record where the time goes.")
+    parser.add_argument("file", help="path to the scene file")
+    parser.add_argument("scene", help="name of the scene class")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-o", "--output", default="render_profile", help="output path, without extension")
+    args = parser.parse_args()
+
+    for path in profile_render(args.file, args.scene, QUALITIES[args.quality], args.output):
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import argparse
+import subprocess
+from pathlib import Path
+
+from manim import *
+
+from render_parallel import QUALITIES, load_scene
+from tex_prewarm import prewarm
+
+
+# Review a long render while it is still running.
+#
+#   python progressive.py Introduction.py Introduction -q l --chunk 4
+#
+# Instead of one partial movie per play call, every frame the renderer
+# produces goes down a single pipe to ffmpeg, which cuts the stream into
+# fixed-length chunks (a keyframe at every chunk boundary) and rewrites
+# media_dir/progressive/<Scene>/playlist.m3u8 after each one. Point a player
+# at the playlist (ffplay, mpv, VLC) a few seconds after the render starts
+# and it keeps playing as new chunks land. When the render ends the chunks
+# are stream-copied into <Scene>.mp4 next to them, without re-encoding.
+#
+# Every play has to produce its frames for the pipe, so manim's movie cache,
+# the frame cache and the segment cache are all off in this mode, and static
+# holds are sent as repeated frames.
+
+class ProgressiveWriter:
+    def __init__(self, directory, chunk_seconds=4):
+        self.directory = Path(directory)
+        self.chunk_seconds = chunk_seconds
+        self.process = None
+
+    @property
+    def playlist(self):
+        return self.directory / "playlist.m3u8"
+
+    def start(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for old in self.directory.glob("chunk_*.ts"):
+            old.unlink()
+        self.process = subprocess.Popen(
+            ["ffmpeg", "-y", "-loglevel", "error",
+             "-f", "rawvideo", "-pix_fmt", "rgba",
+             "-s", f"{config.pixel_width}x{config.pixel_height}", "-r", str(config.frame_rate), "-i", "-",
+             "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23",
+             # Chunks can only start on a keyframe
+             "-force_key_frames", f"expr:gte(t,n_forced*{self.chunk_seconds})", "-sc_threshold", "0",
+             "-f", "hls", "-hls_time", str(self.chunk_seconds), "-hls_list_size", "0",
+             "-hls_playlist_type", "event",
+             "-hls_segment_filename", str(self.directory / "chunk_%05d.ts"), str(self.playlist)],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, frame, num_frames=1):
+        data = frame.tobytes()
+        for _ in range(num_frames):
+            self.process.stdin.write(data)
+
+    def finish(self, output_file):
+        self.process.stdin.close()
+        if self.process.wait():
+            raise RuntimeError(f"ffmpeg exited with status {self.process.returncode}")
+        # The playlist is complete now; one stream copy makes it a single movie
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-i", str(self.playlist), "-c", "copy", str(output_file)],
+            check=True,
+        )
+        return output_file
+
+    def attach(self, scene):
+        write_frame = scene.renderer.file_writer.write_frame
+
+        def progressive_write_frame(frame, num_frames=1):
+            self.write(frame, num_frames)
+            return write_frame(frame, num_frames)
+
+        scene.renderer.file_writer.write_frame = progressive_write_frame
+
+
+def render_progressive(scene_file, scene_name, quality="low_quality", chunk_seconds=4):
+    scene_cls = load_scene(scene_file, scene_name)
+    prewarm(scene_cls)
+    # No partial movie files: the pipe is the only output
+    with tempconfig({"quality": quality, "write_to_movie": False, "disable_caching": True}):
+        writer = ProgressiveWriter(Path(config.media_dir) / "progressive" / scene_name, chunk_seconds)
+        scene = scene_cls()
+        writer.start()
+        print(f"Writing {writer.playlist}")
+        writer.attach(scene)
+        scene.render()
+        return writer.finish(writer.directory / f"{scene_name}.mp4")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a scene as a growing HLS playlist, then one movie.")
+    parser.add_argument("file", help="path to the scene file")
+    parser.add_argument("scene", help="name of the scene class")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--chunk", type=float, default=4, help="chunk length in seconds")
+    args = parser.parse_args()
+
+    print(f"Wrote {render_progressive(args.file, args.scene, QUALITIES[args.quality], args.chunk)}")
+
+
+if __name__ == "__main__":
+    main()
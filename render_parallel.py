@@ -0,0 +1,96 @@
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from manim import tempconfig
+
+from segments import concat_movies
+from tex_prewarm import prewarm
+
+
+# Renders every segment of a SegmentedScene in its own worker process and
+# stitches the results together with a stream-copy concat.
+#
+#   python render_parallel.py Introduction.py Introduction -q l -j 8
+#
+# Each worker replays the segments before its own without rendering (cheap:
+# no rasterizing or encoding) to rebuild the mobjects on screen at its start.
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_scene(scene_file, scene_name):
+    scene_file = Path(scene_file).resolve()
+    sys.path.insert(0, str(scene_file.parent))
+    spec = importlib.util.spec_from_file_location(scene_file.stem, scene_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def render_segment(scene_file, scene_name, segment, quality, variant=None):
+    # variant: (name, overrides) of a scenario, see scenarios.py
+    scene_cls = load_scene(scene_file, scene_name)
+    if variant is not None:
+        scene_cls = scene_cls.variant(*variant)
+    # Each segment gets its own partial movie directory: manim prunes the oldest
+    # files in it when a render finishes, which must not hit another worker's
+    with tempconfig({
+        "quality": quality, "output_file": f"{scene_cls.__name__}_{segment}",
+        "partial_movie_dir": f"{{video_dir}}/partial_movie_files/{{scene_name}}/{segment}",
+    }):
+        scene = scene_cls(render_only=segment)
+        scene.render()
+        # A segment without any play call produces no movie
+        if not scene.rendered_movie_files():
+            return None
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def render_parallel(scene_file, scene_name, quality="high_quality", jobs=None, output_file=None):
+    scene_cls = load_scene(scene_file, scene_name)
+    # Compile the TeX once here, so the workers don't all race to compile the same snippets
+    prewarm(scene_cls, jobs)
+
+    # spawn, not fork: every worker gets its own clean manim config
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=context) as pool:
+        movies = list(pool.map(
+            render_segment, repeat(scene_file), repeat(scene_name), scene_cls.segments, repeat(quality)
+        ))
+
+    movies = [m for m in movies if m is not None]
+    if not movies:
+        raise RuntimeError(f"{scene_name} has no play calls, nothing to concatenate")
+    if output_file is None:
+        output_file = Path(movies[0]).with_name(f"{scene_name}{Path(movies[0]).suffix}")
+    return concat_movies(movies, output_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the segments of a scene in parallel.")
+    parser.add_argument("file", help="path to the scene file")
+    parser.add_argument("scene", help="name of the SegmentedScene class")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("-o", "--output", default=None, help="final movie path")
+    args = parser.parse_args()
+
+    output_file = render_parallel(args.file, args.scene, QUALITIES[args.quality], args.jobs, args.output)
+    print(f"Wrote {output_file}")
+
+
+if __name__ == "__main__":
+    main()
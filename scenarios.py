@@ -0,0 +1,100 @@
+import argparse
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from render_parallel import QUALITIES, load_scene, render_segment
+from segments import concat_movies
+from tex_prewarm import prewarm
+
+
+# Renders several variants of a scene from one scenario file.
+#
+#   python scenarios.py scenarios.json -q l -j 8
+#
+# A scenario file (JSON, or YAML when PyYAML is installed) names the scene
+# and gives each variant the UPPERCASE constants it changes:
+#
+#   {
+#     "file": "Introduction.py",
+#     "scene": "Introduction",
+#     "variants": {
+#       "default": {},
+#       "es": {"NAMES": ["Ana", "Bruno", "Carla", "Diego"], "J_TENSE": 2},
+#       "dark": {"PLUS_ONE_COLOR": "#4FC3F7", "H_COLOR": "#AED581", "NAME_FONT_SIZE": 32}
+#     }
+#   }
+#
+# Colours may be given as hex strings. Each variant becomes a subclass of the
+# scene (SegmentedScene.variant), and every (variant, segment) pair is a job
+# in one process pool, as in render_parallel. All variants use the same
+# media_dir, so the TeX, glyph and text caches are shared. The segment and
+# frame caches key on content, not on the scene's name. The first variant
+# is rendered before the others, so they find its segments and animations in
+# those caches and only render what they change.
+
+def load_scenarios(path):
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+        scenarios = yaml.safe_load(path.read_text())
+    else:
+        scenarios = json.loads(path.read_text())
+    # The scene file is relative to the scenario file
+    scenarios["file"] = str(path.parent / scenarios["file"])
+    return scenarios
+
+
+def render_scenarios(scenarios, quality="high_quality", jobs=None):
+    scene_file, scene_name = scenarios["file"], scenarios["scene"]
+    scene_cls = load_scene(scene_file, scene_name)
+    # Build every variant up front, so a misspelt constant fails before anything renders
+    variants = {name: scene_cls.variant(name, overrides) for name, overrides in scenarios["variants"].items()}
+    for variant_cls in variants.values():
+        prewarm(variant_cls, jobs)
+
+    names = list(variants)
+    context = multiprocessing.get_context("spawn")
+    movies = {}
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=context) as pool:
+        for wave in (names[:1], names[1:]):
+            tasks = [(name, segment) for name in wave for segment in scene_cls.segments]
+            results = pool.map(
+                render_segment, repeat(scene_file), repeat(scene_name), [segment for _, segment in tasks],
+                repeat(quality), [(name, scenarios["variants"][name]) for name, _ in tasks],
+            )
+            for (name, _), movie in zip(tasks, results):
+                if movie is not None:
+                    movies.setdefault(name, []).append(movie)
+
+    missing = [name for name in names if name not in movies]
+    if missing:
+        raise RuntimeError(f"variants {missing} of {scene_name} have no play calls, nothing to concatenate")
+    outputs = {}
+    for name, files in movies.items():
+        output_file = Path(files[0]).with_name(f"{variants[name].__name__}{Path(files[0]).suffix}")
+        outputs[name] = concat_movies(files, output_file)
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every variant in a scenario file.")
+    parser.add_argument("scenarios", help="scenario file (.json, or .yaml with PyYAML)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--only", nargs="+", default=None, help="render just these variants")
+    args = parser.parse_args()
+
+    scenarios = load_scenarios(args.scenarios)
+    if args.only:
+        scenarios["variants"] = {name: scenarios["variants"][name] for name in args.only}
+    outputs = render_scenarios(scenarios, QUALITIES[args.quality], args.jobs)
+    for name, output_file in outputs.items():
+        print(f"{name:16} {output_file}")
+
+
+if __name__ == "__main__":
+    main()
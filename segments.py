@@ -0,0 +1,209 @@
+from manim import *
+import hashlib
+import inspect
+import json
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+from manim.utils.hashing import get_hash_from_play_call
+
+
+# A scene made of named segments (one method per "NEW SEQUENCE" block).
+# Each segment is keyed by its source (with the helpers, class attributes and
+# repo modules it depends on) and by what is on screen when it starts;
+# if that key was rendered before, the segment is replayed without rendering
+# (so the next segment still starts from the right state) and its stored
+# partial movie files are spliced into the final movie.
+#
+# With render_only set, only that segment is rendered: the ones before it are
+# replayed without rendering to rebuild the boundary state and the ones after
+# it are not run at all (see render_parallel.py).
+#
+# Variants of a scene (scenarios.py) are subclasses that override its
+# UPPERCASE constants. A segment's key only covers the constants its source
+# uses, and all variants share one segment directory, so a segment that
+# doesn't depend on what a variant changed is rendered once for all of them.
+class SegmentedScene(Scene):
+    segments = []
+
+    def __init__(self, *args, render_only=None, **kwargs):
+        self.render_only = render_only
+        super().__init__(*args, **kwargs)
+
+    def construct(self):
+        for name in self.segments:
+            self.play_segment(name)
+            if name == self.render_only:
+                break
+
+    def play_segment(self, name):
+        if self.render_only is not None and name != self.render_only:
+            self.next_section(name, skip_animations=True)
+            getattr(self, name)()
+            return
+
+        key = cached = None
+        if self.segment_cache_enabled():
+            key = self.segment_key(name)
+            cached = self.load_segment(key)
+
+        file_writer = self.renderer.file_writer
+        start = len(file_writer.partial_movie_files)
+        self.next_section(name, skip_animations=cached is not None)
+        getattr(self, name)()
+
+        if cached is not None:
+            # combine_to_movie reads the writer's flat list, which has one entry
+            # per play call (None while skipping); the section keeps its own copy
+            file_writer.partial_movie_files[start:] = cached
+            file_writer.sections[-1].partial_movie_files = list(cached)
+        elif key is not None:
+            self.store_segment(key, file_writer.partial_movie_files[start:])
+
+    @classmethod
+    def variant(cls, name, overrides):
+        # A subclass with some UPPERCASE constants replaced; colours may be given as strings
+        unknown = sorted(k for k in overrides if not k.isupper() or not hasattr(cls, k))
+        if unknown:
+            raise ValueError(f"{cls.__name__} has no constants {unknown}")
+        constants = {
+            k: ManimColor(v) if isinstance(getattr(cls, k), ManimColor) else v
+            for k, v in overrides.items()
+        }
+        constants["__module__"] = cls.__module__
+        return type(cls.__name__ + "_" + re.sub(r"\W", "_", name), (cls,), constants)
+
+    def rendered_movie_files(self):
+        return [f for f in self.renderer.file_writer.partial_movie_files if f]
+
+    def segment_cache_enabled(self):
+        return config.write_to_movie and not config.disable_caching and not config.dry_run
+
+    def segment_source(self, name):
+        # The segment's method, every scene method it reaches through self.x
+        # (helpers of helpers too), the scene's class attributes those use
+        # (node_radius, the UPPERCASE constants) and the repo modules the
+        # scene builds its mobjects from
+        own = {}
+        for cls in type(self).__mro__:
+            if cls is SegmentedScene:
+                break
+            for attr, value in vars(cls).items():
+                own.setdefault(attr, value)
+
+        parts, attributes, seen, pending = [], {}, set(), [name]
+        while pending:
+            attr = pending.pop()
+            if attr in seen or attr not in own or attr.startswith("__"):
+                continue
+            seen.add(attr)
+            value = own[attr]
+            if isinstance(value, (staticmethod, classmethod)):
+                value = value.__func__
+            elif isinstance(value, property):
+                value = value.fget
+            if inspect.isfunction(value):
+                source = inspect.getsource(value)
+                parts.append(source)
+                # Other segments have keys of their own
+                pending.extend(sorted(set(re.findall(r"self\.(\w+)", source)) - set(self.segments), reverse=True))
+            elif not callable(value):
+                attributes[attr] = value
+        parts.append(repr(sorted((k, repr(v)) for k, v in attributes.items())))
+
+        scene_module = inspect.getmodule(type(self))
+        for module in local_modules(scene_module):
+            if module is not scene_module:
+                parts.append(inspect.getsource(module))
+        return "\n".join(parts)
+
+    def segment_key(self, name):
+        digest = hashlib.sha256()
+        digest.update(self.segment_source(name).encode())
+        # The input state is whatever is on screen at the segment boundary
+        digest.update(get_hash_from_play_call(self, self.camera, [], self.mobjects).encode())
+        digest.update(repr((
+            config.pixel_width, config.pixel_height, config.frame_rate,
+            str(config.background_color), config.movie_file_extension,
+        )).encode())
+        return digest.hexdigest()[:16]
+
+    def segment_dir(self, key):
+        # Variants are subclasses; they share the directory of the scene they vary
+        scene_cls = type(self).__mro__[type(self).__mro__.index(SegmentedScene) - 1]
+        return Path(config.media_dir) / "segments" / scene_cls.__name__ / key
+
+    def load_segment(self, key):
+        manifest = self.segment_dir(key) / "manifest.json"
+        if not manifest.exists():
+            return None
+        files = [str(manifest.parent / f) for f in json.loads(manifest.read_text())["files"]]
+        if not all(Path(f).exists() for f in files):
+            return None
+        return files
+
+    def store_segment(self, key, partial_movie_files):
+        # Only complete segments are stored (None means a play call was skipped)
+        if None in partial_movie_files:
+            return
+        directory = self.segment_dir(key)
+        # Filled in a temporary directory and renamed into place, so a process
+        # loading this key never sees a half-copied segment
+        tmp = directory.with_name(f"{key}.{os.getpid()}.tmp")
+        tmp.mkdir(parents=True, exist_ok=True)
+        names = []
+        for i, partial in enumerate(partial_movie_files):
+            names.append(f"{i:05}{Path(partial).suffix}")
+            shutil.copyfile(partial, tmp / names[-1])
+        (tmp / "manifest.json").write_text(json.dumps({"files": names}))
+        try:
+            os.replace(tmp, directory)
+            return
+        except OSError:
+            pass
+        if self.load_segment(key) is None:
+            # A stale directory with missing files, left by a crash or an
+            # eviction: it would make this key miss on every run, so replace it
+            shutil.rmtree(directory, ignore_errors=True)
+            try:
+                os.replace(tmp, directory)
+                return
+            except OSError:
+                pass
+        # Another process stored the same segment first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def local_modules(module):
+    # The module and every module next to it that it imports, directly or
+    # through each other (ising_graph, live_equation, glyphs, ...), by name
+    root = Path(module.__file__).resolve().parent
+    found, pending = {}, [module]
+    while pending:
+        mod = pending.pop()
+        if mod.__name__ in found:
+            continue
+        found[mod.__name__] = mod
+        for value in vars(mod).values():
+            dep = value if inspect.ismodule(value) else inspect.getmodule(value)
+            path = getattr(dep, "__file__", None)
+            if path and dep.__name__ not in found and Path(path).resolve().parent == root:
+                pending.append(dep)
+    return [found[name] for name in sorted(found)]
+
+
+def concat_movies(movie_files, output_file):
+    # Stream copy, no re-encode: every movie was written with the same settings
+    output_file = Path(output_file)
+    list_file = output_file.with_suffix(".txt")
+    list_file.write_text("".join(f"file '{Path(f).resolve().as_posix()}'\n" for f in movie_files))
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", str(list_file), "-c", "copy", str(output_file)],
+        check=True,
+    )
+    list_file.unlink()
+    return output_file
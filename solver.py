@@ -0,0 +1,126 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+
+import ising
+
+
+# Heuristic ground-state search for N far beyond ising.enumerate_states:
+# simulated annealing and parallel tempering (replica exchange) on the same
+# coupling matrices.
+#
+# Every replica is a row of an (R, N) spin array, and all replicas are swept
+# at once. Within a sweep the spins are updated one colour class at a time:
+# a greedy colouring of the coupling graph puts uncoupled spins in the same
+# class, so a whole class is a valid simultaneous Metropolis update. Local
+# fields h = s J are kept up to date, so a flip costs only its class's rows
+# of J. J can be dense or sparse CSR (instances.py); with sparse couplings a
+# sweep costs O(edges), not O(N^2). The copies are split over a process pool
+# to use every core.
+#
+# Results carry the best configuration found and the best energy after each
+# sweep, which a scene can animate.
+
+SolverResult = namedtuple("SolverResult", "best_energy best_spins trace")
+
+
+def color_classes(full):
+    n = full.shape[0]
+    if sparse.issparse(full):
+        neighbours = np.split(full.indices, full.indptr[1:-1])
+    else:
+        neighbours = [np.flatnonzero(full[i]) for i in range(n)]
+    colors = np.full(n, -1)
+    # Most connected spins first, each gets the lowest colour its neighbours don't use
+    for i in np.argsort([-len(nb) for nb in neighbours], kind="stable"):
+        used = set(colors[neighbours[i]].tolist())
+        color = 0
+        while color in used:
+            color += 1
+        colors[i] = color
+    return [np.flatnonzero(colors == c) for c in range(colors.max() + 1)]
+
+
+def metropolis_sweep(blocks, classes, spins, fields, energies, betas, rng):
+    for block, cls in zip(blocks, classes):
+        s = spins[:, cls]
+        dE = -2 * s * fields[:, cls]
+        accept = rng.random(dE.shape) < np.exp(-np.maximum(betas[:, None] * dE, 0))
+        spins[:, cls] = np.where(accept, -s, s)
+        energies += np.where(accept, dE, 0).sum(axis=1)
+        # (B^T c^T)^T rather than c @ B, which works for a sparse block as well
+        fields += (block.T @ np.where(accept, -2.0 * s, 0.0).T).T
+
+
+def replica_exchange(spins, fields, energies, betas, temperatures, offset, rng):
+    # Replica r runs at temperature r % temperatures; neighbouring temperatures
+    # swap configurations, even pairs on one call and odd pairs on the next
+    copies = len(betas) // temperatures
+    t = np.arange(offset, temperatures - 1, 2)
+    a = (np.arange(copies)[:, None] * temperatures + t).ravel()
+    b = a + 1
+    delta = (betas[a] - betas[b]) * (energies[a] - energies[b])
+    swap = rng.random(len(a)) < np.exp(np.minimum(delta, 0))
+    a, b = a[swap], b[swap]
+    for array in (spins, fields, energies):
+        array[np.concatenate([a, b])] = array[np.concatenate([b, a])]
+
+
+def _run(J, schedule, temperatures, seed):
+    # schedule: (sweeps, R) inverse temperature of every replica at every sweep
+    rng = np.random.default_rng(seed)
+    full = ising.symmetric_couplings(J).astype(float)
+    classes = color_classes(full)
+    blocks = [full[cls] for cls in classes]
+
+    sweeps, replicas = schedule.shape
+    spins = rng.choice(np.array([-1, 1], dtype=np.int8), size=(replicas, full.shape[0]))
+    fields = (full @ spins.T).T
+    energies = 0.5 * (spins * fields).sum(axis=1)
+
+    best_energy, best_spins = np.inf, spins[0].copy()
+    trace = np.empty(sweeps)
+    for sweep, betas in enumerate(schedule):
+        metropolis_sweep(blocks, classes, spins, fields, energies, betas, rng)
+        if temperatures:
+            replica_exchange(spins, fields, energies, betas, temperatures, sweep % 2, rng)
+        i = np.argmin(energies)
+        if energies[i] < best_energy:
+            best_energy, best_spins = energies[i], spins[i].copy()
+        trace[sweep] = best_energy
+    return best_energy, best_spins, trace
+
+
+def _solve(J, schedules, temperatures, seed, jobs):
+    seeds = np.random.SeedSequence(seed).spawn(len(schedules))
+    if len(schedules) == 1:
+        runs = [_run(J, schedules[0], temperatures, seeds[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            runs = list(pool.map(_run, [J] * len(schedules), schedules, [temperatures] * len(schedules), seeds))
+
+    best = min(runs, key=lambda run: run[0])
+    # Recompute exactly: the running energies are updated incrementally in floating point
+    return SolverResult(
+        ising.energy(J, best[1]), best[1], np.minimum.reduce([run[2] for run in runs]),
+    )
+
+
+def _split(total, jobs):
+    jobs = max(1, min(jobs or os.cpu_count(), total))
+    return [len(part) for part in np.array_split(np.arange(total), jobs)]
+
+
+def simulated_annealing(J, sweeps=1000, replicas=64, beta_start=0.1, beta_end=5.0, seed=None, jobs=None):
+    betas = np.geomspace(beta_start, beta_end, sweeps)
+    schedules = [np.repeat(betas[:, None], count, axis=1) for count in _split(replicas, jobs)]
+    return _solve(J, schedules, None, seed, jobs)
+
+
+def parallel_tempering(J, sweeps=1000, temperatures=16, copies=8, beta_min=0.1, beta_max=5.0, seed=None, jobs=None):
+    ladder = np.geomspace(beta_min, beta_max, temperatures)
+    schedules = [np.tile(ladder, (sweeps, count)) for count in _split(copies, jobs)]
+    return _solve(J, schedules, temperatures, seed, jobs)
@@ -0,0 +1,75 @@
+from manim import *
+
+
+# Spin arrows that flip in place.
+#
+# A state change used to build a fresh up or down arrow with .copy() and
+# Transform the node's arrow into it: one new mobject per flip, plus point
+# alignment and a target copy on every play. Each node now keeps one
+# SpinArrow for the whole video, and FlipSpin mirrors its points along the
+# arrow's own axis, straight from the points it had when the flip began.
+# That is the same motion as the old up -> down Transform (the arrow shrinks
+# through its centre and grows out the other way) with nothing allocated per
+# frame, and a FlipSpin to the spin the arrow already has does nothing, so a
+# row of new spins can be played as one FlipSpin per node.
+#
+#   arrows = [SpinArrow(s).move_to(node) for s, node in zip(spins, nodes)]
+#   self.play(*[FlipSpin(arrow, s) for arrow, s in zip(arrows, new_spins)])
+
+class SpinArrow(Arrow):
+    def __init__(self, spin=1, length=0.4, stroke_width=3, max_tip_length_to_length_ratio=0.35, **kwargs):
+        super().__init__(
+            DOWN * length / 2, UP * length / 2,
+            stroke_width=stroke_width, max_tip_length_to_length_ratio=max_tip_length_to_length_ratio, **kwargs,
+        )
+        self.spin = 1
+        self.set_spin(spin)
+
+    def axis(self):
+        return normalize(self.get_end() - self.get_start())
+
+    def mirror(self, amount=1.0, starts=None, center=None, axis=None):
+        # amount 0 leaves the points where they are, 1 reflects them across the centre
+        center = self.get_center() if center is None else center
+        axis = self.axis() if axis is None else axis
+        parts = [mob for mob in self.get_family() if len(mob.points)]
+        starts = [mob.points for mob in parts] if starts is None else starts
+        for mob, start in zip(parts, starts):
+            along = (start - center) @ axis
+            mob.points = start - 2 * amount * along[:, None] * axis
+        return self
+
+    def set_spin(self, spin):
+        if spin != self.spin:
+            self.mirror()
+            self.spin = spin
+        return self
+
+
+class FlipSpin(Animation):
+    def __init__(self, arrow, spin=None, **kwargs):
+        # spin: the spin to end on; None flips whatever the arrow shows
+        self.target_spin = -arrow.spin if spin is None else spin
+        super().__init__(arrow, **kwargs)
+
+    def create_starting_mobject(self):
+        # The start is kept as raw points in begin(), no copy of the arrow
+        return self.mobject
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+    def begin(self):
+        arrow = self.mobject
+        self.flips = self.target_spin != arrow.spin
+        self.center, self.axis = arrow.get_center(), arrow.axis()
+        self.starts = [mob.points.copy() for mob in arrow.get_family() if len(mob.points)]
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        if self.flips:
+            self.mobject.mirror(self.rate_func(alpha), self.starts, self.center, self.axis)
+
+    def finish(self):
+        super().finish()
+        self.mobject.spin = self.target_spin
@@ -0,0 +1,42 @@
+from manim import *
+import av
+
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+# Static holds (self.wait(3) with nothing moving) converted for the encoder once.
+#
+# manim already rasterizes a static wait only once (freeze_current_frame), but
+# then hands the encoder that RGBA frame num_frames times, and every one of
+# them is converted to YUV on its way in: 90 colour conversions of the same
+# image for a 3 second wait at 30 fps. Here a frame written num_frames times
+# is converted once, and the encoder gets copies of the YUV frame.
+#
+# Every frame is still written, one per frame at the stream's constant frame
+# rate, so a hold is a still stretch of real duration that manim's
+# combine_files and segments.concat_movies join like any other. x264 codes a
+# repeated frame as all skipped blocks, so the extra frames cost next to
+# nothing in time or in size. (Writing a hold as two frames with a timestamp
+# gap does not survive concatenation: the partial file reports a duration of
+# two frames and the concat demuxer drops or rejects the rest.)
+#
+# Only yuv420p streams are handled; transparent (qtrle, yuva420p) and GIF
+# output keep manim's frame-by-frame path.
+
+def install():
+    original = SceneFileWriter.encode_and_write_frame
+    if getattr(original, "static_hold", False):
+        return
+
+    def encode_and_write_frame(self, frame, num_frames):
+        if num_frames <= 1 or self.video_stream.pix_fmt != "yuv420p":
+            return original(self, frame, num_frames)
+        yuv = av.VideoFrame.from_ndarray(frame, format="rgba").reformat(format="yuv420p").to_ndarray()
+        for _ in range(num_frames):
+            # A fresh frame each time: manim found reused av frames render wrongly
+            av_frame = av.VideoFrame.from_ndarray(yuv, format="yuv420p")
+            for packet in self.video_stream.encode(av_frame):
+                self.video_container.mux(packet)
+
+    encode_and_write_frame.static_hold = True
+    SceneFileWriter.encode_and_write_frame = encode_and_write_frame
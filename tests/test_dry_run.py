@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("manim")
+import dry_run
+
+SCENE = """
+from manim import *
+
+
+class Small(Scene):
+    def construct(self):
+        # Fully on screen, nothing to report
+        self.play(FadeIn(Square(side_length=1)))
+        self.play(FadeOut(self.mobjects[0]))
+        # Sticks out on the right by 8.5 - frame_x_radius
+        self.play(FadeIn(Square(side_length=1).move_to(RIGHT * 8)))
+        self.play(FadeOut(self.mobjects[0]))
+        # Two squares overlapping by a 1 x 2 strip, and a dot inside a circle
+        self.play(
+            FadeIn(Square(side_length=2).move_to(LEFT * 3)), FadeIn(Square(side_length=2).move_to(LEFT * 2)),
+            FadeIn(Circle(radius=1).move_to(RIGHT * 3)), FadeIn(Dot(RIGHT * 3)),
+        )
+        self.wait(2)
+"""
+
+
+def test_overflow_and_overlap_on_a_real_scene(tmp_path):
+    from manim import config
+
+    scene_file = tmp_path / "small_scene.py"
+    scene_file.write_text(SCENE)
+    report = dry_run.dry_run(scene_file, "Small")
+
+    assert report["calls"] == 6
+    assert report["timeline"]["total"] == pytest.approx(5 * 1 + 2)
+
+    assert len(report["overflows"]) == 1
+    overflow = report["overflows"][0]
+    assert overflow["call"] == 2 and overflow["mobject"] == "Square"
+    assert overflow["by"] == pytest.approx(8.5 - config.frame_x_radius, abs=0.01)
+
+    # The dot in the circle is composition, not a clash
+    assert len(report["overlaps"]) == 1
+    overlap = report["overlaps"][0]
+    assert overlap["call"] == 4 and overlap["mobjects"] == ["Square", "Square"]
+    assert overlap["area"] == pytest.approx(2.0, abs=0.05)
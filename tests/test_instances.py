@@ -0,0 +1,64 @@
+import numpy as np
+
+import ising
+from instances import load_instance, parse_instance
+
+
+def test_general_mtx_with_both_directions_matches_dense_energy(tmp_path):
+    path = tmp_path / "pair.mtx"
+    path.write_text(
+        "%%MatrixMarket matrix coordinate real general\n"
+        "2 2 2\n"
+        "1 2 1\n"
+        "2 1 1\n"
+    )
+    J = parse_instance(path)
+    dense = np.array([[0, 1], [1, 0]])
+    spins = np.array([[1, 1], [1, -1]])
+    assert J.toarray().tolist() == [[0, 1], [0, 0]]
+    assert ising.energies(J, spins).tolist() == ising.energies(dense, spins).tolist()
+
+
+def test_general_mtx_upper_triangle_only(tmp_path):
+    path = tmp_path / "upper.mtx"
+    path.write_text(
+        "%%MatrixMarket matrix coordinate real general\n"
+        "3 3 2\n"
+        "1 2 -1\n"
+        "2 3 2\n"
+    )
+    assert parse_instance(path).toarray().tolist() == [[0, -1, 0], [0, 0, 2], [0, 0, 0]]
+
+
+def test_gset(tmp_path):
+    path = tmp_path / "g.txt"
+    path.write_text("3 2\n1 2 1\n2 3 -1\n")
+    assert parse_instance(path).toarray().tolist() == [[0, 1, 0], [0, 0, -1], [0, 0, 0]]
+
+
+def test_headerless_unweighted_edge_list_is_not_gset(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("0 1\n1 2\n2 0\n")
+    assert parse_instance(path).toarray().tolist() == [[0, 1, 1], [0, 0, 1], [0, 0, 0]]
+
+
+def test_general_mtx_mixed_orientation_keeps_weights(tmp_path):
+    # Each pair is listed once, on either side of the diagonal: nothing to fold
+    path = tmp_path / "mixed.mtx"
+    path.write_text(
+        "%%MatrixMarket matrix coordinate real general\n"
+        "3 3 2\n"
+        "1 2 1\n"
+        "3 1 2\n"
+    )
+    assert parse_instance(path).toarray().tolist() == [[0, 1, 2], [0, 0, 0], [0, 0, 0]]
+
+
+def test_energies_use_the_memory_mapped_matrix(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("0 1 1\n1 2 -2\n0 3 1\n")
+    load_instance(path)
+    J = load_instance(path)
+    assert ising.upper_couplings(J) is J
+    spins = ising.all_configurations(4)
+    assert ising.energies(J, spins).tolist() == ising.energies(J.toarray(), spins).tolist()
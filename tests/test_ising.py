@@ -0,0 +1,95 @@
+import itertools
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+import ising
+
+
+def explicit_energy(J, s):
+    # H(s) = sum_{i<j} s_i J_ij s_j, term by term
+    n = len(s)
+    return sum(s[i] * J[i][j] * s[j] for i in range(n) for j in range(i + 1, n))
+
+
+def random_couplings(n, seed, integer=True):
+    rng = np.random.default_rng(seed)
+    upper = np.triu(rng.integers(-2, 3, (n, n)) if integer else rng.normal(size=(n, n)), 1)
+    return upper + upper.T
+
+
+@pytest.mark.parametrize("to_input", [np.asarray, sparse.csr_matrix, lambda J: np.triu(J, 1)])
+def test_energies_match_explicit_sum(to_input):
+    J = random_couplings(6, seed=1)
+    spins = ising.all_configurations(6)
+    expected = [explicit_energy(J, s) for s in spins.tolist()]
+    assert ising.energies(to_input(J), spins).tolist() == expected
+
+
+def test_energies_float_couplings():
+    J = random_couplings(5, seed=2, integer=False)
+    spins = ising.all_configurations(5)
+    expected = [explicit_energy(J, s) for s in spins.tolist()]
+    assert np.allclose(ising.energies(J, spins), expected)
+    assert np.allclose(ising.energies(sparse.csr_matrix(J), spins), expected)
+
+
+def test_energy_of_one_configuration():
+    J = ising.coupling_matrix(3, {(0, 1): 1, (1, 2): -1, (0, 2): 1})
+    for s in itertools.product([1, -1], repeat=3):
+        assert ising.energy(J, s) == explicit_energy(J, s)
+        assert ising.energy(sparse.csr_matrix(J), s) == explicit_energy(J, s)
+
+
+def brute_force(J):
+    spins = ising.all_configurations(len(J))
+    E = np.array([explicit_energy(J, s) for s in spins.tolist()])
+    ground = np.flatnonzero(E == E.min())
+    return E, ground
+
+
+def check_enumeration(J, **kwargs):
+    E, ground = brute_force(J)
+    result = ising.enumerate_states(J, **kwargs)
+    assert result.ground_energy == E.min()
+    assert result.degeneracy == len(ground)
+    assert result.ground_states.tolist() == ground.tolist()
+    values, counts = np.unique(E, return_counts=True)
+    assert result.histogram[0].tolist() == values.tolist()
+    assert result.histogram[1].tolist() == counts.tolist()
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 7])
+def test_enumerate_states_matches_brute_force(n):
+    check_enumeration(random_couplings(n, seed=n))
+
+
+def test_enumerate_states_chunked(monkeypatch):
+    # Several Gray-code chunks in one block, each starting from a fresh state
+    monkeypatch.setattr(ising, "CHUNK_SIZE", 16)
+    check_enumeration(random_couplings(6, seed=3))
+
+
+def test_enumerate_states_process_pool(monkeypatch):
+    # 2^8 states > 4 chunks of 8, so the blocks go to worker processes
+    monkeypatch.setattr(ising, "CHUNK_SIZE", 8)
+    check_enumeration(random_couplings(8, seed=4), jobs=2)
+
+
+def test_enumerate_states_sparse_and_max_states():
+    J = np.zeros((4, 4), dtype=np.int64)
+    result = ising.enumerate_states(sparse.csr_matrix(J), max_states=3)
+    # No couplings: every configuration is a ground state
+    assert result.degeneracy == 16
+    # The first ones found in Gray-code order
+    assert result.ground_states.tolist() == [0, 1, 3]
+
+
+def test_enumerate_states_float_histogram():
+    J = random_couplings(5, seed=5, integer=False)
+    E, ground = brute_force(J)
+    result = ising.enumerate_states(J, bins=32)
+    assert np.isclose(result.ground_energy, E.min())
+    assert result.degeneracy == len(ground)
+    assert result.histogram[1].sum() == 2 ** 5
@@ -0,0 +1,47 @@
+import numpy as np
+
+import label_layout
+
+
+def square_edges(radius=0.3):
+    positions = np.array([[-2, 2, 0], [2, 2, 0], [-2, -2, 0], [2, -2, 0]], dtype=float)
+    pairs = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+    endpoints = []
+    for i, j in pairs:
+        unit = (positions[j] - positions[i]) / np.linalg.norm(positions[j] - positions[i])
+        endpoints.append([positions[i] + unit * radius, positions[j] - unit * radius])
+    return positions, np.array(endpoints)
+
+
+def test_rotated_overlap_is_smaller_than_its_bounding_box():
+    # A diamond just touching the square's corner region: the boxes overlap, the shapes barely do
+    diamond = [(1.0, 0.0), (2.0, 1.0), (1.0, 2.0), (0.0, 1.0)]
+    index = label_layout.GridIndex(cell_size=1.0)
+    index.insert((0.0, 0.0, 2.0, 2.0), diamond)
+    assert index.overlap((1.6, 1.6, 2.6, 2.6)) < 0.05
+    assert np.isclose(index.overlap((0.0, 0.0, 2.0, 2.0)), 2.0)
+
+
+def test_square_diagonal_labels_stay_off_the_nodes():
+    positions, endpoints = square_edges()
+    index = label_layout.GridIndex(cell_size=1.2)
+    label_layout.add_nodes(index, positions, 0.3)
+    alphas = label_layout.place_edge_labels(index, endpoints, [(0.95, 0.65)] * len(endpoints))
+    # The sides keep the middle; the diagonals only move as far as they must to clear each other
+    assert alphas.tolist()[:3] == [0.5, 0.5, 0.5]
+    assert alphas[3] in (0.3, 0.4, 0.6, 0.7)
+
+
+def test_partial_overlaps_skip_contained_boxes():
+    boxes = [
+        (-4.0, -1.0, -2.0, 1.0),   # square
+        (-3.0, -1.0, -1.0, 1.0),   # square overlapping it by half
+        (1.0, 1.0, 3.0, 3.0),      # circle's box
+        (1.5, 1.5, 2.5, 2.5),      # arrow inside the circle
+    ]
+    assert list(label_layout.partial_overlaps(boxes)) == [(0, 1, 2.0)]
+
+
+def test_overflow():
+    assert label_layout.overflow((7.0, -1.0, 9.0, 1.0), 7.11, 4.0) == 9.0 - 7.11
+    assert label_layout.overflow((-1.0, -1.0, 1.0, 1.0), 7.11, 4.0) < 0
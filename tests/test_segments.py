@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+from manim import ManimColor, tempconfig
+
+from render_parallel import load_scene
+
+SCENE_FILE = Path(__file__).resolve().parent.parent / "Introduction.py"
+
+
+@pytest.fixture(scope="module")
+def Introduction():
+    return load_scene(SCENE_FILE, "Introduction")
+
+
+def test_variant_overrides_constants(Introduction):
+    es = Introduction.variant("es-ES", {"NAMES": ["Ana", "Bruno", "Carla", "Diego"], "J_COLOR": "#4FC3F7"})
+    assert issubclass(es, Introduction)
+    assert es.__name__ == "Introduction_es_ES"
+    assert es.__module__ == Introduction.__module__
+    assert es.NAMES == ["Ana", "Bruno", "Carla", "Diego"]
+    # Colours given as strings become ManimColor, like the defaults
+    assert isinstance(es.J_COLOR, ManimColor) and es.J_COLOR.to_hex().upper() == "#4FC3F7"
+    assert Introduction.J_COLOR != es.J_COLOR
+
+
+@pytest.mark.parametrize("overrides", [{"NOT_A_CONSTANT": 1}, {"node_radius": 0.5}])
+def test_variant_rejects_unknown_constants(Introduction, overrides):
+    with pytest.raises(ValueError):
+        Introduction.variant("bad", overrides)
+
+
+def keys(scene_cls):
+    with tempconfig({"dry_run": True, "disable_caching": True, "progress_bar": "none"}):
+        scene = scene_cls()
+        return {name: scene.segment_key(name) for name in scene_cls.segments}
+
+
+def test_variants_share_the_segments_they_dont_change(Introduction):
+    base = keys(Introduction)
+    font = keys(Introduction.variant("font", {"NAME_FONT_SIZE": 32}))
+    # Every segment that draws names, directly or through create_person / IsingGraph
+    changed = {"intro", "tension", "three_people", "n_four"}
+    assert {name for name in base if base[name] != font[name]} == changed
+
+    h_color = keys(Introduction.variant("h", {"H_COLOR": "#AED581"}))
+    assert {name for name in base if base[name] != h_color[name]} == {"live_calculation", "ground_state", "hamiltonian"}
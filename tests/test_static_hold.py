@@ -0,0 +1,49 @@
+import shutil
+
+import pytest
+
+pytest.importorskip("manim")
+av = pytest.importorskip("av")
+from manim import *
+
+import static_hold
+from segments import concat_movies
+
+
+class HoldScene(Scene):
+    def construct(self):
+        self.play(FadeIn(Square()), run_time=1)
+        self.wait(2)
+        self.play(FadeOut(self.mobjects[0]), run_time=1)
+
+
+def movie_length(path):
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        frames = sum(1 for _ in container.decode(stream))
+        return frames, float(container.duration) / av.time_base
+
+
+def test_wait_survives_combine_and_concat(tmp_path):
+    static_hold.install()
+    with tempconfig({"media_dir": str(tmp_path), "quality": "low_quality", "progress_bar": "none"}):
+        scene = HoldScene()
+        scene.render()
+        fps = config.frame_rate
+        partial_files = [f for f in scene.renderer.file_writer.partial_movie_files if f]
+        movie = scene.renderer.file_writer.movie_file_path
+
+    # 1 s fade in, 2 s hold, 1 s fade out, every frame there
+    frames, duration = movie_length(movie)
+    assert frames == 4 * fps
+    assert duration == pytest.approx(4, abs=1.5 / fps)
+
+    frames, duration = movie_length(partial_files[1])
+    assert frames == 2 * fps
+    assert duration == pytest.approx(2, abs=1.5 / fps)
+
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg not installed")
+    frames, duration = movie_length(concat_movies(partial_files, tmp_path / "concat.mp4"))
+    assert frames == 4 * fps
+    assert duration == pytest.approx(4, abs=1.5 / fps)
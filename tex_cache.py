@@ -0,0 +1,211 @@
+from manim import *
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+
+from manim import __version__ as manim_version
+
+from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+from manim.utils.iterables import hash_obj
+
+
+# Persistent glyph cache for MathTex/Tex (and every other SVGMobject).
+#
+# manim already keeps the compiled .svg files on disk and the parsed mobjects
+# in SVG_HASH_TO_MOB_MAP, but that map dies with the process, so every run and
+# every render_parallel worker parses the same SVGs again. This cache pickles
+# the parsed submobjects (their class and every attribute, so a warm glyph is
+# indistinguishable from a cold one) keyed by the SVG content, shared by all
+# processes using the same media_dir, with least-recently-used eviction once
+# the directory grows past max_bytes.
+#
+# Text and MarkupText get a second cache one level up. Even with the SVG in
+# text_dir and its paths in the glyph cache, every construction lists the
+# fonts, rewrites the SVG and closes each glyph's curves point by point in
+# Python. The layout cache keys the finished mobject by its class and every
+# constructor argument (markup, font, size, slant/weight, justify,
+# line_spacing, colour, ...) and pickles its state, so a warm construction is
+# one file read and no Pango at all.
+
+class GlyphCache:
+    name = "glyph_cache"
+    suffix = ".pickle"
+
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024):
+        self._directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Bytes in the directory, as far as this process knows
+        self.total = None
+
+    @property
+    def directory(self):
+        # Resolved lazily: the CLI sets media_dir after this module is imported
+        return Path(self._directory or Path(config.media_dir) / self.name)
+
+    def key(self, svg_mobject):
+        digest = hashlib.sha256()
+        # Pickled submobjects are only valid for the manim that made them
+        digest.update(manim_version.encode())
+        for part in svg_mobject.hash_seed:
+            if isinstance(part, (str, Path)) and Path(part).suffix == ".svg":
+                digest.update(Path(part).read_bytes())
+            else:
+                digest.update(repr(part).encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def read(self, key):
+        path = self.path(key)
+        try:
+            # Touched first, so eviction sees it as recently used; if another
+            # process evicts it in between, that is just a miss
+            os.utime(path)
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def write(self, key, data):
+        try:
+            data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Something unpicklable (a callable, a live object); just don't cache it
+            return
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so other processes never read a half-written file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        self.commit(tmp, path)
+
+    def load(self, key):
+        # The parsed submobjects themselves (VMobjectFromSVGPath with all their
+        # attributes), so a warm glyph hashes like a cold one
+        submobjects = self.read(key)
+        return None if submobjects is None else VMobject().add(*submobjects)
+
+    def store(self, key, mob):
+        self.write(key, list(mob.submobjects))
+
+    def commit(self, tmp, path):
+        size = tmp.stat().st_size
+        os.replace(tmp, path)
+        # The directory is scanned once per process, then only when over budget
+        if self.total is None:
+            self.total = self.directory_size()
+        else:
+            self.total += size
+        if self.total > self.max_bytes:
+            self.evict()
+
+    def cached_files(self):
+        files = []
+        for f in self.directory.glob(f"*/*{self.suffix}"):
+            try:
+                files.append((f.stat(), f))
+            except FileNotFoundError:
+                # Evicted by another process in the meantime
+                pass
+        return files
+
+    def directory_size(self):
+        return sum(stat.st_size for stat, _ in self.cached_files())
+
+    def evict(self):
+        files = self.cached_files()
+        total = sum(stat.st_size for stat, _ in files)
+        # Drop the least recently used files until we are back under 90% of the budget
+        if total > self.max_bytes:
+            for stat, f in sorted(files, key=lambda item: item[0].st_mtime):
+                if total <= 0.9 * self.max_bytes:
+                    break
+                f.unlink(missing_ok=True)
+                total -= stat.st_size
+        self.total = total
+
+
+class LayoutCache(GlyphCache):
+    name = "text_cache"
+
+    def key(self, cls, arguments):
+        # arguments: the bound constructor arguments, defaults included
+        digest = hashlib.sha256()
+        digest.update(repr((manim_version, config.renderer, cls.__name__)).encode())
+        for name, value in arguments.items():
+            digest.update(f"{name}={value!r};".encode())
+        return digest.hexdigest()
+
+    def load(self, key):
+        return self.read(key)
+
+    def store(self, key, mob):
+        self.write(key, mob.__dict__)
+
+
+glyph_cache = GlyphCache()
+layout_cache = LayoutCache()
+
+
+def install(cache=glyph_cache):
+    # Put the on-disk cache underneath manim's in-memory SVG cache
+    original = SVGMobject.init_svg_mobject
+    if getattr(original, "glyph_cache", None) is not None:
+        return
+
+    def init_svg_mobject(self, use_svg_cache):
+        # OpenGL mobjects store their data differently; leave them to manim
+        if not use_svg_cache or not isinstance(self, VMobject):
+            return original(self, use_svg_cache)
+
+        hash_val = hash_obj(self.hash_seed)
+        key = None
+        if hash_val not in SVG_HASH_TO_MOB_MAP:
+            key = cache.key(self)
+            mob = cache.load(key)
+            if mob is not None:
+                SVG_HASH_TO_MOB_MAP[hash_val] = mob
+                key = None
+
+        original(self, use_svg_cache)
+        if key is not None:
+            cache.store(key, SVG_HASH_TO_MOB_MAP[hash_val])
+
+    init_svg_mobject.glyph_cache = cache
+    SVGMobject.init_svg_mobject = init_svg_mobject
+    install_layouts()
+
+
+def install_layouts(cache=layout_cache, classes=(Text, MarkupText)):
+    for cls in classes:
+        original = cls.__init__
+        if getattr(original, "layout_cache", None) is not None:
+            continue
+        signature = inspect.signature(original)
+
+        def __init__(self, *args, original=original, signature=signature, cls=cls, **kwargs):
+            # Subclasses add their own arguments and state; only cache the class itself
+            if type(self) is not cls:
+                return original(self, *args, **kwargs)
+            arguments = signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            del arguments.arguments["self"]
+            key = cache.key(cls, arguments.arguments)
+
+            state = cache.load(key)
+            if state is not None:
+                self.__dict__.update(state)
+                return
+            original(self, *args, **kwargs)
+            cache.store(key, self)
+
+        __init__.layout_cache = cache
+        cls.__init__ = __init__
@@ -0,0 +1,118 @@
+from manim import *
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import delete_nonsvg_files, tex_to_svg_file
+
+from segments import local_modules
+
+
+# Compiles every TeX snippet a scene needs before its first play call, with
+# the latex/dvisvgm jobs running side by side instead of one at a time in the
+# middle of the timeline.
+#
+# The snippets are collected by running construct once without rendering and
+# with tex_to_svg_file swapped for a recorder that hands back a placeholder
+# glyph, so f-string variants (get_calc_text, create_gs_vector, table cells)
+# are found exactly as the scene builds them. The list is kept in a manifest
+# per version of the scene's source, so warm runs skip the collection pass.
+#
+# render_parallel, scenarios and progressive prewarm before they render. For
+# a plain `manim render`, prewarm first:
+#
+#   python tex_prewarm.py Introduction.py Introduction -j 8
+
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+    '<path d="M 0 0 L 10 0 L 10 10 Z"/></svg>'
+)
+
+
+def collect_tex(scene_cls):
+    placeholder = Path(tempfile.gettempdir()) / "tex_prewarm_placeholder.svg"
+    placeholder.write_text(PLACEHOLDER_SVG)
+    snippets = {}
+
+    def record(expression, environment=None, tex_template=None):
+        template = tex_template or config.tex_template
+        snippets.setdefault((expression, environment, template.body), (expression, environment, template))
+        return placeholder
+
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = record
+    complete = False
+    # Warnings about the placeholder glyphs' layout are meaningless here
+    level = logger.level
+    logger.setLevel("ERROR")
+    try:
+        with tempconfig({"write_to_movie": False, "disable_caching": True}):
+            scene = scene_cls(skip_animations=True)
+            scene.setup()
+            scene.construct()
+        complete = True
+    except Exception:
+        # Layout code may trip over the placeholder glyphs; whatever was
+        # collected up to that point is still worth compiling
+        logger.setLevel(level)
+        logger.warning(f"TeX collection for {scene_cls.__name__} stopped early", exc_info=True)
+    finally:
+        tex_mobject.tex_to_svg_file = original
+        logger.setLevel(level)
+    # complete: construct ran to the end, so the list has every snippet
+    return list(snippets.values()), complete
+
+
+def manifest_path(scene_cls):
+    # The scene module and the repo modules it builds TeX from (hamiltonian_tex, live_equation, ...)
+    source = "\n".join(inspect.getsource(module) for module in local_modules(inspect.getmodule(scene_cls)))
+    # Scenario variants change constants, not source
+    constants = repr(sorted((k, repr(v)) for k, v in vars(scene_cls).items() if k.isupper()))
+    digest = hashlib.sha256((source + constants).encode()).hexdigest()[:16]
+    return Path(config.media_dir) / "Tex" / "prewarm" / f"{scene_cls.__name__}_{digest}.json"
+
+
+def prewarm(scene_cls, jobs=None):
+    manifest = manifest_path(scene_cls)
+    if manifest.exists() and all(Path(f).exists() for f in json.loads(manifest.read_text())):
+        return
+
+    snippets, complete = collect_tex(scene_cls)
+    # latex and dvisvgm are subprocesses, so threads are enough to keep every core busy.
+    # Each compile would normally clean up the whole tex_dir after itself,
+    # deleting the other jobs' .dvi/.aux files mid-compile; clean up once at the end
+    cleanup = not config["no_latex_cleanup"]
+    with tempconfig({"no_latex_cleanup": True}):
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            svg_files = list(pool.map(lambda snippet: tex_to_svg_file(*snippet), snippets))
+    if cleanup:
+        delete_nonsvg_files()
+
+    # A partial list would make every later run skip the snippets it missed
+    if complete:
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        manifest.write_text(json.dumps([str(f) for f in svg_files]))
+    logger.info(f"Prewarmed {len(svg_files)} TeX snippets for {scene_cls.__name__}")
+
+
+def main():
+    # Imported here: render_parallel imports this module
+    from render_parallel import load_scene
+
+    parser = argparse.ArgumentParser(description="Compile every TeX snippet of a scene in parallel.")
+    parser.add_argument("file", help="path to the scene file")
+    parser.add_argument("scene", help="name of the scene class")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="parallel compiles (default: all cores)")
+    args = parser.parse_args()
+
+    prewarm(load_scene(args.file, args.scene), args.jobs)
+
+
+if __name__ == "__main__":
+    main()